@@ -4,6 +4,7 @@ __author__ = ["Hongyi Yang"]
 import pandas as pd
 
 from NetworkSim.architecture.base.network import Network
+from NetworkSim.architecture.setup.debug import DEBUG
 from NetworkSim.architecture.signal.control import ControlSignal
 from NetworkSim.architecture.signal.data import DataSignal
 
@@ -94,12 +95,13 @@ class Node:
             Control code in decimal.
         """
         # Check type and length of the incoming packet
-        if self.control_signal.abstract:
-            if not isinstance(packet, list):
-                raise ValueError('Abstract signal must be a list.')
-        else:
-            if not isinstance(packet, str):
-                raise ValueError('Signal input must be a string.')
+        if DEBUG:
+            if self.control_signal.abstract:
+                if not isinstance(packet, list):
+                    raise ValueError('Abstract signal must be a list.')
+            else:
+                if not isinstance(packet, str):
+                    raise ValueError('Signal input must be a string.')
         # Control packet interpretation
         if self.control_signal.abstract:
             return packet[0], packet[1], packet[2]
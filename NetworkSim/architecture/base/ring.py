@@ -2,6 +2,203 @@ __all__ = ["Ring"]
 __author__ = ["Hongyi Yang"]
 
 import numpy as np
+import pandas as pd
+
+from NetworkSim.architecture.setup.debug import DEBUG
+
+
+def _is_packet_at_node(entry_time, entry_location, current_time, speed, length, node_location, reversed_):
+    """
+    Check if a packet on the ring is located at a node.
+
+    This confirms the candidate packets found through the phase bins in `Ring.check_packet`.
+
+    Parameters
+    ----------
+    entry_time : float
+        Time when the packet was added onto the ring.
+    entry_location : float
+        Location where the packet was added onto the ring.
+    current_time : float
+        Current time when the packet is checked.
+    speed : float
+        Distance travelled by a packet per unit time.
+    length : float
+        Length of the ring.
+    node_location : float
+        Location of the node at which the check is performed.
+    reversed_ : bool
+        If the ring is reversed.
+
+    Returns
+    -------
+    existence : bool
+        ``True`` if the packet is located at the node.
+    """
+    new_location_on_ring = (entry_location + (current_time - entry_time) * speed) % length
+    # Calculate location on reversed ring
+    if reversed_:
+        new_location_on_ring = (2 * entry_location - new_location_on_ring) % length
+    # Update location when near end of the ring and causing no detection error
+    if abs(new_location_on_ring - length) < 1e-2:
+        new_location_on_ring = 0
+    return abs(new_location_on_ring - node_location) < 1e-2
+
+
+def _packet_locations(entry_time, entry_location, num_packets, current_time, speed, length, reversed_):
+    """
+    Calculate the current locations of all packets on the ring, in [0, length).
+
+    Parameters
+    ----------
+    entry_time : numpy array
+        Times when the packets were added onto the ring.
+    entry_location : numpy array
+        Locations where the packets were added onto the ring.
+    num_packets : int
+        Number of packets on the ring.
+    current_time : float
+        Current time when the packets are checked.
+    speed : float
+        Distance travelled by a packet per unit time.
+    length : float
+        Length of the ring.
+    reversed_ : bool
+        If the ring is reversed.
+
+    Returns
+    -------
+    locations : numpy array
+        The locations of the packets.
+    """
+    _entry_location = entry_location[:num_packets]
+    new_location_on_ring = np.mod(_entry_location + (current_time - entry_time[:num_packets]) * speed, length)
+    # Calculate location on reversed ring
+    if reversed_:
+        new_location_on_ring = np.mod(2 * _entry_location - new_location_on_ring, length)
+    return new_location_on_ring
+
+
+def _check_packet_vectorised(entry_time, entry_location, num_packets, current_time, speed, length, node_location,
+                             reversed_):
+    """
+    Find the first packet on the ring located at a node, checking all packets at once with numpy.
+
+    This is used on rings too short to be split into phase bins. \
+    It takes the parameters of `_packet_locations`, and the location of the node at which the check is performed.
+
+    Returns
+    -------
+    index : int
+        Index of the packet located at the node, ``-1`` if there is none.
+    """
+    new_location_on_ring = _packet_locations(entry_time, entry_location, num_packets, current_time, speed, length,
+                                             reversed_)
+    # Update location when near end of the ring and causing no detection error
+    new_location_on_ring[np.abs(new_location_on_ring - length) < 1e-2] = 0
+    _match = np.abs(new_location_on_ring - node_location) < 1e-2
+    if _match.any():
+        return int(_match.argmax())
+    return -1
+
+
+class PacketRecordBuffer:
+    """
+    Buffer storing the packet transmission record of a ring.
+
+    Each operation is written as one row of a numpy structured array that grows geometrically.
+
+    Parameters
+    ----------
+    capacity : int, optional
+        The initial number of rows allocated. Default is ``64``.
+    """
+
+    __slots__ = (
+        '_size',
+        '_rows',
+    )
+
+    columns = [
+        'Generation Timestamp',
+        'Transmission Timestamp',
+        'Reception Timestamp',
+        'Raw Packet',
+        'Source Node',
+        'Destination Node',
+        'Status',
+        'Total Packet Count'
+    ]
+    dtype = np.dtype([
+        ('generation_timestamp', np.float64),
+        ('transmission_timestamp', np.float64),
+        ('reception_timestamp', np.float64),
+        ('raw_packet', object),
+        ('source', np.int32),
+        ('destination', np.int32),
+        ('removed', np.bool_),
+        ('count', np.int32)
+    ])
+
+    def __init__(self, capacity=64):
+        self._size = 0
+        self._rows = np.empty(capacity, dtype=self.dtype)
+
+    def __len__(self):
+        return self._size
+
+    def append(self, generation_timestamp, transmission_timestamp, reception_timestamp, raw_packet, source,
+               destination, removed, count):
+        """
+        Append a row to the record.
+
+        Parameters
+        ----------
+        generation_timestamp : float
+            The timestamp when the packet is generated.
+        transmission_timestamp : float
+            The timestamp when the packet is added onto the ring.
+        reception_timestamp : float
+            The timestamp when the packet is removed from the ring, ``nan`` if the packet is added.
+        raw_packet : str
+            The raw packet content.
+        source : int
+            The ID of the source node.
+        destination : int
+            The ID of the destination node.
+        removed : bool
+            ``True`` if the packet is removed from the ring, ``False`` if it is added.
+        count : int
+            The total number of packets on the ring after the operation.
+        """
+        _index = self._size
+        if _index == self._rows.size:
+            # Double the capacity when full
+            self._rows = np.resize(self._rows, 2 * _index)
+        self._rows[_index] = (generation_timestamp, transmission_timestamp, reception_timestamp, raw_packet,
+                              source, destination, removed, count)
+        self._size = _index + 1
+
+    def to_dataframe(self):
+        """
+        Build a DataFrame of the record.
+
+        Returns
+        -------
+        packet_record : pandas DataFrame
+            The record, with the columns listed in `columns`.
+        """
+        _rows = self._rows[:self._size]
+        return pd.DataFrame({
+            'Generation Timestamp': _rows['generation_timestamp'],
+            'Transmission Timestamp': _rows['transmission_timestamp'],
+            'Reception Timestamp': _rows['reception_timestamp'],
+            'Raw Packet': _rows['raw_packet'],
+            'Source Node': _rows['source'],
+            'Destination Node': _rows['destination'],
+            'Status': np.where(_rows['removed'], 'removed', 'added'),
+            'Total Packet Count': _rows['count']
+        }, columns=self.columns)
 
 
 class Ring:
@@ -13,7 +210,8 @@ class Ring:
     Parameters
     ----------
     model : Model
-        The network model used. Default is ``Model()``.
+        The network model used. Default is ``Model()``. \
+        The speed of light and the ring length are read from the model when the ring is created.
     time_unit : str
         The time unit used for the simulation, chosen from the following:
 
@@ -27,9 +225,9 @@ class Ring:
     ring_id : int
         The ID of the ring. Default is ``None``.
     nodes_location : array
-        Array of locations of the nodes on the ring, in meters.
+        Array of locations of the nodes on the ring, in meters, shared with the model.
     packets : list
-        List of packets present on the ring, containing:
+        List of packets present on the ring, each stored as a tuple containing:
 
         - `raw_packet` : str
             The raw packet string.
@@ -43,15 +241,18 @@ class Ring:
             The ID of the node where the packet was added.
         - `destination_node_id` : int
             The ID of the destination of the packet.
-    packet_record : list
-        A list containing the information on all packet transmission on the ring, including the columns:
+
+        Each packet is identified by its `transmission_timestamp` and `entry_node_id`, as only one packet can be \
+        added at a node at a time.
+    packet_record : pandas DataFrame
+        A DataFrame built on request from the transmission record of the ring, including the columns:
 
         - `Generation Timestamp` : float
             The timestamp when the packet is generated and stored in the RAM.
         - `Transmission Timestamp` : float
             The timestamp when the packet is added onto the ring by the transmitter.
         - `Reception Timestamp` : float
-            The timestamp when the packet is received by the receiver.
+            The timestamp when the packet is received by the receiver, ``NaN`` for added packets.
         - `Raw Packet` : str
             The raw packet content.
         - `Source Node` : int
@@ -64,6 +265,30 @@ class Ring:
             The total number of packets on the ring at the time of the operation.
     """
 
+    __slots__ = (
+        'model',
+        'ring_id',
+        'nodes_location',
+        'packets',
+        'packet_count',
+        'time_unit',
+        'reversed',
+        '_speed',
+        '_length',
+        '_entry_time',
+        '_entry_location',
+        '_packet_index',
+        '_circulation_period',
+        '_num_phase_bins',
+        '_phase_bin_width',
+        '_phase_bins',
+        '_packet_record',
+        '_version',
+        '_poll_time',
+        '_poll_version',
+        '_poll_result',
+    )
+
     def __init__(
             self,
             model,
@@ -73,12 +298,40 @@ class Ring:
     ):
         self.model = model
         self.ring_id = ring_id
-        self.nodes_location = self.get_nodes_location()
+        self.nodes_location = self.model.nodes_location
         self.packets = []
         self.packet_count = 0
-        self.packet_record = []
+        self._packet_record = PacketRecordBuffer()
         self.time_unit = time_unit
         self.reversed = reversed
+        # Distance travelled by a packet per unit time, and the ring length, used for location checks
+        if self.time_unit == 'ns':
+            self._speed = self.model.constants.get('speed') * 1e-9
+        elif self.time_unit == 's':
+            self._speed = self.model.constants.get('speed')
+        else:
+            raise NotImplementedError('Unknown time unit of the simulation.')
+        self._length = self.model.network.length
+        # Entry time and location of the packets on the ring, stored as arrays aligned with `packets`
+        self._entry_time = np.empty(16, dtype=np.float64)
+        self._entry_location = np.empty(16, dtype=np.float64)
+        # Index of each packet in `packets`, keyed by its transmission timestamp and entry node ID
+        self._packet_index = {}
+        # Packets are binned by the phase of their circulation, with bins wider than the location tolerance,
+        # so that a check only looks at the packets in neighbouring bins
+        self._circulation_period = self._length / self._speed
+        self._num_phase_bins = int(self._circulation_period * self._speed / 1e-2) - 1
+        self._phase_bin_width = self._circulation_period / max(self._num_phase_bins, 1)
+        self._phase_bins = {}
+        # Result of the last poll of all nodes, valid until the packets on the ring change or time moves on
+        self._version = 0
+        self._poll_time = None
+        self._poll_version = None
+        self._poll_result = {}
+
+    @property
+    def packet_record(self):
+        return self._packet_record.to_dataframe()
 
     def get_nodes_location(self):
         """
@@ -94,10 +347,36 @@ class Ring:
                                 num=self.model.network.num_nodes + 1)
         return locations[:-1]
 
+    def _get_phase_bin(self, time, location):
+        """
+        Get the phase bin of a time at a location on the ring.
+
+        A packet is found at a node when the phase bin of its transmission at its entry point is close to \
+        the phase bin of the check at the node.
+
+        Parameters
+        ----------
+        time : float
+            The time.
+        location : float
+            The location on the ring.
+
+        Returns
+        -------
+        phase_bin : int
+            The phase bin.
+        """
+        if self.reversed:
+            _phase = time + location / self._speed
+        else:
+            _phase = time - location / self._speed
+        return int((_phase % self._circulation_period) // self._phase_bin_width) % self._num_phase_bins
+
     def add_packet(self, node_id, destination_id, packet, generation_timestamp, transmission_timestamp):
         """
         Packet addition to the ring.
-        The packet added will be in the format `[raw_packet, timestamp, node_id]`.
+        The packet added will be a tuple in the format `(raw_packet, generation_timestamp, transmission_timestamp, \
+        packet_entry_point, entry_node_id, destination_node_id)`.
 
         Parameters
         ----------
@@ -113,29 +392,44 @@ class Ring:
             The timestamp when the packet is added.
         """
         # Check input types
-        if not isinstance(node_id, int):
+        if DEBUG and not isinstance(node_id, int):
             raise ValueError('Input node_id must be an integer.')
 
+        _key = (transmission_timestamp, node_id)
+        if _key in self._packet_index:
+            raise ValueError('A packet has already been added at node ' + str(node_id) + ' at this time.')
+        # Grow the entry arrays geometrically when full
+        _index = len(self.packets)
+        if _index == self._entry_time.size:
+            self._entry_time = np.resize(self._entry_time, 2 * _index)
+            self._entry_location = np.resize(self._entry_location, 2 * _index)
+        self._entry_time[_index] = transmission_timestamp
+        self._entry_location[_index] = self.nodes_location[node_id]
+        self._packet_index[_key] = _index
+        if self._num_phase_bins >= 3:
+            _phase_bin = self._get_phase_bin(transmission_timestamp, self.nodes_location[node_id])
+            self._phase_bins.setdefault(_phase_bin, []).append(_key)
         # Add packet to the ring
-        self.packets.append([
+        self.packets.append((
             packet,
             generation_timestamp,
             transmission_timestamp,
             self.nodes_location[node_id],
             node_id,
             destination_id
-        ])
+        ))
         self.packet_count += 1
-        self.packet_record.append([
+        self._version += 1
+        self._packet_record.append(
             generation_timestamp,
             transmission_timestamp,
-            None,
+            np.nan,
             packet,
             node_id,
             destination_id,
-            'added',
+            False,
             self.packet_count
-        ])
+        )
 
     def remove_packet(self, node_id, packet, reception_timestamp):
         """
@@ -158,18 +452,35 @@ class Ring:
         reception_timestamp : float
             The timestamp at which the packet is removed.
         """
-        self.packets.remove(packet)
+        # Swap the packet with the last one on the ring to remove it from the entry arrays in O(1)
+        _key = (packet[2], packet[4])
+        _index = self._packet_index.pop(_key)
+        if self._num_phase_bins >= 3:
+            _phase_bin = self._get_phase_bin(packet[2], packet[3])
+            _bin = self._phase_bins[_phase_bin]
+            _bin.remove(_key)
+            if not _bin:
+                del self._phase_bins[_phase_bin]
+        _last = len(self.packets) - 1
+        if _index != _last:
+            _last_packet = self.packets[_last]
+            self.packets[_index] = _last_packet
+            self._packet_index[(_last_packet[2], _last_packet[4])] = _index
+        self._entry_time[_index] = self._entry_time[_last]
+        self._entry_location[_index] = self._entry_location[_last]
+        self.packets.pop()
         self.packet_count -= 1
-        self.packet_record.append([
+        self._version += 1
+        self._packet_record.append(
             packet[1],
             packet[2],
             reception_timestamp,
             packet[0],
             packet[4],
             node_id,
-            'removed',
+            True,
             self.packet_count
-        ])
+        )
 
     def check_packet(self, current_time, node_id):
         """
@@ -197,29 +508,71 @@ class Ring:
             - `destination_node_id`
         """
         # Check input
-        if not isinstance(node_id, int):
+        if DEBUG and not isinstance(node_id, int):
             raise ValueError('Input node_id must be an integer.')
         # Check presence of packet based on current time
-        for packet in self.packets:
-            # Compare current location of packet with node location with time in ns
-            if self.time_unit == 'ns':
-                _new_location = packet[3] + (current_time - packet[2]) * self.model.constants.get('speed') * 1e-9
-            elif self.time_unit == 's':
-                _new_location = packet[3] + (current_time - packet[2]) * self.model.constants.get('speed')
-            else:
-                raise NotImplementedError('Unknown time unit of the simulation.')
-            new_location_on_ring = _new_location % self.model.network.length
-            # Calculate location on reversed ring
-            if self.reversed:
-                new_location_on_ring = packet[3] - (new_location_on_ring - packet[3])
-                if new_location_on_ring < 0:
-                    new_location_on_ring += self.model.network.length
-                elif new_location_on_ring > self.model.network.length:
-                    new_location_on_ring -= self.model.network.length
-            # Update location when near end of the ring and causing no detection error
-            if np.isclose(new_location_on_ring, self.model.network.length, atol=1e-2):
-                new_location_on_ring = 0
-            if np.isclose(new_location_on_ring, self.nodes_location[node_id], atol=1e-2):
-                return True, packet
-        # No packet present
-        return False, None
+        _num_packets = len(self.packets)
+        if not _num_packets:
+            return False, None
+        _node_location = self.nodes_location[node_id]
+        if self._num_phase_bins >= 3:
+            # Only the packets in the phase bin of the check and its neighbours can be at the node
+            _phase_bin = self._get_phase_bin(current_time, _node_location)
+            _candidates = []
+            for _offset in (-1, 0, 1):
+                for _key in self._phase_bins.get((_phase_bin + _offset) % self._num_phase_bins, ()):
+                    _candidates.append(self._packet_index[_key])
+            if not _candidates:
+                return False, None
+            # Confirm the candidates in their order on the ring, from the transmission time and entry point of each
+            _candidates.sort()
+            for _index in _candidates:
+                _packet = self.packets[_index]
+                if _is_packet_at_node(_packet[2], _packet[3], current_time, self._speed, self._length,
+                                      _node_location, self.reversed):
+                    return True, _packet
+            return False, None
+        _index = _check_packet_vectorised(self._entry_time, self._entry_location, _num_packets, current_time,
+                                          self._speed, self._length, _node_location, self.reversed)
+        if _index < 0:
+            return False, None
+        return True, self.packets[_index]
+
+    def poll_all(self, current_time):
+        """
+        Packet existence check at all nodes at once.
+
+        The location of each packet is computed once and mapped to its nearest node, \
+        which relies on the nodes being evenly spaced around the ring. \
+        The result is reused by all nodes polling at the same time, until a packet is added or removed.
+
+        Parameters
+        ----------
+        current_time : float
+            Current time when the packets are checked.
+
+        Returns
+        -------
+        packets : dict
+            The packet present at each node, keyed by node ID. Nodes without a packet are not included. \
+            If more than one packet is present at a node, the one returned by `check_packet` is given.
+        """
+        if current_time == self._poll_time and self._version == self._poll_version:
+            return self._poll_result
+        _num_packets = len(self.packets)
+        packets = {}
+        if _num_packets:
+            _num_nodes = self.model.network.num_nodes
+            new_location_on_ring = _packet_locations(self._entry_time, self._entry_location, _num_packets,
+                                                     current_time, self._speed, self._length, self.reversed)
+            # Nearest node of each packet, where a packet near the end of the ring is nearest to node 0
+            _nearest_node = np.rint(new_location_on_ring * (_num_nodes / self._length)).astype(np.intp) % _num_nodes
+            _distance = np.abs(new_location_on_ring - self.nodes_location[_nearest_node])
+            _match = (_distance < 1e-2) | (_distance > self._length - 1e-2)
+            # Go through the matches backwards so that the first packet on the list is kept at each node
+            for _index in np.flatnonzero(_match)[::-1].tolist():
+                packets[int(_nearest_node[_index])] = self.packets[_index]
+        self._poll_time = current_time
+        self._poll_version = self._version
+        self._poll_result = packets
+        return packets
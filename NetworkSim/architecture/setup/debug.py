@@ -0,0 +1,9 @@
+__all__ = ["DEBUG"]
+__author__ = ["Hongyi Yang"]
+
+import os
+
+# Type checks of inputs on the simulation hot path, such as node IDs and interpreted control packets,
+# are only performed when debugging. They are enabled by setting the environment variable
+# NETWORKSIM_DEBUG to 1 before NetworkSim is imported.
+DEBUG = os.environ.get('NETWORKSIM_DEBUG') == '1'
@@ -35,6 +35,8 @@ class Model:
     ----------
     nodes : list
         A list containing the nodes in the model
+    nodes_location : numpy array
+        A read-only array of the locations of the nodes on the rings, in meters, shared by all rings.
     data_rings : list
         A list containing the data rings in the model
     control_ring : Ring
@@ -75,11 +77,7 @@ class Model:
         self.network = network
         self.abstract = abstract
         self.bidirectional = bidirectional
-        self.nodes = self.generate_nodes()
-        self.data_rings = self.generate_data_rings()
-        if self.bidirectional:
-            self.reversed_data_rings = self.generate_reversed_data_rings()
-        self.control_ring = self.generate_control_ring()
+        # Constants are defined before the rings, which read the speed of light on creation
         self.constants = {
             'speed': 2e8,  # speed of light in fibre, in m/s
             'maximum_bit_rate': 100,  # system burst rate (maximum bit rate), in Gbit/s
@@ -88,9 +86,16 @@ class Model:
             'control_guard_interval': 0.14,  # guard interval of control packets in ns
             'tuning_time': 20  # tuning time of the receiver in ns
         }
+        self.nodes = self.generate_nodes()
+        self.nodes_location = self.get_nodes_location()
+        self.data_rings = self.generate_data_rings()
+        if self.bidirectional:
+            self.reversed_data_rings = self.generate_reversed_data_rings()
+        self.control_ring = self.generate_control_ring()
         self.data_packet_duration = self.get_data_packet_total_duration()
         self.circulation_time = self.get_circulation_time()
         self.max_data_packet_num_on_ring = self.get_max_data_packet_num_on_ring()
+        self._clock_cycles = {}  # Clock cycles keyed by clock type and the configuration they are calculated from
 
     def get_circulation_time(self):
         """
@@ -185,6 +190,78 @@ class Model:
         # Type cast at the end to avoid TypeError: 'numpy.float64' object cannot be interpreted as an integer
         return max_packet_num_between_node
 
+    def get_clock_cycle(self, clock_type):
+        """
+        Get the clock cycle of a synchronised clock.
+
+        The clock cycle is calculated once and reused, until the constants or signals it depends on are changed.
+
+        Parameters
+        ----------
+        clock_type : str
+            The type of the clock, chosen from the following:
+
+            - 'transmitter_data' : the clock of all transmitters on data rings
+            - 'receiver_data' : the clock of all receivers on data rings
+            - 'control' : the clock of all transmitters and receivers on the control ring
+
+        Returns
+        -------
+        clock_cycle : float
+            The clock cycle.
+        """
+        _key = (
+            clock_type,
+            self.circulation_time,
+            self.network.length,
+            self.network.num_nodes,
+            self.data_signal.size,
+            self.control_signal.id_length,
+            self.control_signal.control_length,
+            self.constants.get('speed'),
+            self.constants.get('maximum_bit_rate'),
+            self.constants.get('data_guard_interval'),
+            self.constants.get('control_guard_interval')
+        )
+        clock_cycle = self._clock_cycles.get(_key)
+        if clock_cycle is None:
+            if clock_type == 'transmitter_data':
+                # Calculate clock cycle and check if it is a good option for simulation
+                if int(self.get_max_data_packet_num_on_ring()) & 1:
+                    raise ValueError('This configuration would result in data packet '
+                                     'transmission clock cycle not being a suitable number.')
+                clock_cycle = self.circulation_time / self.get_max_data_packet_num_on_ring()
+            elif clock_type == 'receiver_data':
+                clock_cycle = self.circulation_time / np.lcm(
+                    int(self.network.num_nodes),
+                    int(self.get_max_data_packet_num_on_ring())
+                )
+            elif clock_type == 'control':
+                # Calculate clock cycle and check if it is a good option for simulation
+                if int(self.get_max_control_packet_num_on_ring()) & 1:
+                    raise ValueError("This configuration would result in control packet "
+                                     "transmission clock cycle not being a suitable number.")
+                clock_cycle = self.circulation_time / self.get_max_control_packet_num_on_ring()
+            else:
+                raise ValueError("Clock type not recognised.")
+            self._clock_cycles[_key] = clock_cycle
+        return clock_cycle
+
+    def get_nodes_location(self):
+        """
+        Get locations of all nodes on the rings.
+
+        Returns
+        -------
+        locations : numpy array
+            A read-only array of node locations.
+        """
+        locations = np.linspace(start=0,
+                                stop=self.network.length,
+                                num=self.network.num_nodes + 1)[:-1]
+        locations.flags.writeable = False
+        return locations
+
     def generate_nodes(self):
         """
         Generate a list of nodes based on the network configuration.
@@ -3,6 +3,8 @@ __author__ = ["Hongyi Yang"]
 
 import pandas as pd
 
+from NetworkSim.architecture.setup.debug import DEBUG
+
 
 class ControlSignal:
     """
@@ -29,6 +31,15 @@ class ControlSignal:
         A dictionary containing information about the control bits.
     """
 
+    __slots__ = (
+        'id_length',
+        'control_length',
+        'abstract',
+        'control_info',
+        '_id_table',
+        '_control_table',
+    )
+
     def __init__(
             self,
             id_length=7,
@@ -43,6 +54,9 @@ class ControlSignal:
             0: 'New Data',
             1: 'Removed Data'
         }
+        # Binary representations of all IDs and control codes, looked up during packet generation
+        self._id_table = [f'{i:0{id_length}b}' for i in range(1 << id_length)]
+        self._control_table = [f'{i:0{control_length}b}' for i in range(1 << control_length)]
 
     def get_code(self, code):
         """
@@ -76,7 +90,7 @@ class ControlSignal:
         """
         info = {
             'Decimal': list(self.control_info.keys()),
-            'Binary': [bin(n)[2:].zfill(self.control_length) for n in list(self.control_info.keys())],
+            'Binary': [self._control_table[n] for n in self.control_info.keys()],
             'Representation': list(self.control_info.values())
         }
         return pd.DataFrame.from_dict(info)
@@ -119,13 +133,11 @@ class ControlSignal:
             - `Control Code`
         """
         # Check input types
-        if not isinstance(source, int) or not isinstance(destination, int) or not isinstance(control_code, int):
+        if DEBUG and (not isinstance(source, int) or not isinstance(destination, int) or
+                      not isinstance(control_code, int)):
             raise ValueError('All inputs must be integers.')
         # Generate all three parts of the control packet
         if self.abstract:
             return [source, destination, control_code]
         else:
-            packet_source = bin(source)[2:].zfill(self.id_length)
-            packet_destination = bin(destination)[2:].zfill(self.id_length)
-            packet_control = bin(control_code)[2:].zfill(self.control_length)
-            return packet_source + packet_destination + packet_control
+            return self._id_table[source] + self._id_table[destination] + self._control_table[control_code]
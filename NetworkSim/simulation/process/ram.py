@@ -2,8 +2,12 @@ __all__ = ["RAM"]
 __author__ = ["Hongyi Yang"]
 
 from collections import deque
+from itertools import repeat
+
+import numpy as np
 
 from NetworkSim.architecture.setup.model import Model
+from NetworkSim.simulation.tools.dataframe import cached_df
 from NetworkSim.simulation.tools.distribution import Distribution
 
 
@@ -32,7 +36,7 @@ class RAM:
         If the system is bidirectional, default is ``False``. \
             If ``True``, `upstream_queue` and `downstream_queue` will be set up.
     seed : int, optional
-        The seed used for source traffic generation. Default is ``1``.
+        The seed used for source traffic generation, shared by all RAMs in the network. Default is ``1``.
 
     Attributes
     ----------
@@ -43,22 +47,25 @@ class RAM:
         - `Interarrival to Next`
         - `Raw Packet`
         - `Destination ID`
+    generated_data_packet_df : pandas DataFrame
+        A DataFrame of `generated_data_packet`, built when requested.
     queue : deque
-        A queue containing the remaining data packets in the RAM for unidirectional transmission, with the fields:
+        A queue containing the remaining data packets in the RAM for unidirectional transmission, \
+            each stored as a tuple with the fields:
 
         - `timestamp`
         - `data_packet`
         - `destination_id`
     upstream_queue : deque
         A queue containing the remaining data packets in the RAM  in the upstream direction \
-            for bidirectional transmission, with the fields:
+            for bidirectional transmission, each stored as a tuple with the fields:
 
         - `timestamp`
         - `data_packet`
         - `destination_id`
     downstream_queue : deque
         A queue containing the remaining data packets in the RAM  in the downstream direction \
-            for bidirectional transmission, with the fields:
+            for bidirectional transmission, each stored as a tuple with the fields:
 
         - `timestamp`
         - `data_packet`
@@ -78,6 +85,33 @@ class RAM:
         - `downstream_queue_length`
     """
 
+    __slots__ = (
+        'env',
+        'until',
+        'ram_id',
+        'bidirectional',
+        'model',
+        'distribution_type',
+        'generated_data_packet',
+        '_generated_data_packet_df',
+        'queue',
+        'upstream_queue',
+        'downstream_queue',
+        '_distribution',
+        '_batch_size',
+        '_interarrival_stream',
+        '_destination_stream',
+        '_interarrival',
+        '_next_interarrival',
+        '_abstract_data_id',
+        'add_to_queue_record',
+        'pop_from_queue_record',
+        'queue_size_record',
+        '_packet_event',
+    )
+
+    batch_size = 4096  # Maximum number of interarrival times and destinations drawn from the distribution at once
+
     def __init__(
             self,
             env,
@@ -97,19 +131,84 @@ class RAM:
         self.model = model
         self.distribution_type = distribution
         self.generated_data_packet = []
+        self._generated_data_packet_df = None
         if self.bidirectional:
             self.upstream_queue = deque()
             self.downstream_queue = deque()
         else:
             self.queue = deque()
-        self._distribution = Distribution(seed=seed * ram_id, model=model)
+        # Each RAM draws from its own child of the seed sequence, so that the sources are statistically independent
+        self._distribution = Distribution(seed=np.random.SeedSequence(seed, spawn_key=(ram_id,)), model=model)
+        # Random samples are drawn in batches on demand and consumed one at a time from streams,
+        # where the batches are sized to the number of packets expected in the simulation time if it is known
+        if until is None:
+            self._batch_size = self.batch_size
+        else:
+            _expected_packet_num = int(1.5 * until * self._distribution.poisson_lambda) + 1
+            self._batch_size = min(self.batch_size, max(16, _expected_packet_num))
+        if self.distribution_type == 'pareto':
+            self._interarrival_stream = self._sample_stream(self._distribution.pareto)
+        elif self.distribution_type == 'poisson':
+            self._interarrival_stream = self._sample_stream(self._distribution.poisson)
+        else:
+            self._interarrival_stream = repeat(None)
+        self._destination_stream = self._sample_stream(self._sample_destination)
         self._interarrival = self.get_interarrival()
         self._next_interarrival = 0
-        self._destination_ids = self.get_destination_ids()  # List of possible destination to send packets to
         self._abstract_data_id = 0  # Data ID counter when data packets are abstract
         self.add_to_queue_record = []
         self.pop_from_queue_record = []
         self.queue_size_record = []
+        self._packet_event = None  # Event triggered by the next data packet added to the queue
+
+    @property
+    def generated_data_packet_df(self):
+        return cached_df(
+            process=self,
+            records=self.generated_data_packet,
+            cache_attr='_generated_data_packet_df',
+            columns=['Timestamp', 'Interarrival to Next', 'Raw Packet', 'Destination ID']
+        )
+
+    def _sample_stream(self, sample):
+        """
+        Generator of random samples, drawn from the distribution in batches of at most `batch_size`.
+
+        Parameters
+        ----------
+        sample : function
+            The `Distribution` method used to draw the samples.
+
+        Yields
+        ------
+        sample : float or int
+            A new sample.
+        """
+        while True:
+            yield from sample(size=self._batch_size).tolist()
+
+    def _sample_destination(self, size):
+        """
+        Draw a batch of destination IDs.
+
+        The uniform index is counted from the node following the RAM, so that the RAM itself is never chosen.
+
+        Parameters
+        ----------
+        size : int
+            Number of destination IDs to draw.
+
+        Returns
+        -------
+        destination_ids : ndarray
+            The destination IDs.
+        """
+        _num_nodes = self.model.network.num_nodes
+        destination_ids = self._distribution.uniform(size=size) + (self.ram_id + 1)
+        # Wrap around the ring with a bit mask when the number of nodes is a power of two
+        if not _num_nodes & (_num_nodes - 1):
+            return destination_ids & (_num_nodes - 1)
+        return destination_ids % _num_nodes
 
     def get_new_destination(self):
         """
@@ -120,7 +219,7 @@ class RAM:
         destination_id : int
             The ID of the new destination node.
         """
-        return self._destination_ids[self._distribution.uniform()]
+        return next(self._destination_stream)
 
     def get_destination_ids(self):
         """
@@ -129,13 +228,10 @@ class RAM:
         Returns
         -------
         destination_ids : list
-            List of destination IDs.
+            List of destination IDs, in the order of the uniform index drawn in `_sample_destination`.
         """
-        destination_ids = []
-        for i in range(self.model.network.num_nodes):
-            if i != self.ram_id:
-                destination_ids.append(i)
-        return destination_ids
+        _num_nodes = self.model.network.num_nodes
+        return [(self.ram_id + 1 + i) % _num_nodes for i in range(_num_nodes - 1)]
 
     def get_interarrival(self):
         """
@@ -146,10 +242,7 @@ class RAM:
         interarrival : float
             A new interval time
         """
-        if self.distribution_type == 'pareto':
-            return self._distribution.pareto()
-        if self.distribution_type == 'poisson':
-            return self._distribution.poisson()
+        return next(self._interarrival_stream)
 
     def is_upstream(self, destination_id):
         """
@@ -195,15 +288,32 @@ class RAM:
             data_packet,
             destination_id
         ])
+        _queued_packet = (timestamp, data_packet, destination_id)
         if self.bidirectional:
             if self.is_upstream(destination_id=destination_id):
-                self.upstream_queue.append([timestamp, data_packet, destination_id])
+                self.upstream_queue.append(_queued_packet)
             else:
-                self.downstream_queue.append([timestamp, data_packet, destination_id])
+                self.downstream_queue.append(_queued_packet)
         else:
-            self.queue.append([timestamp, data_packet, destination_id])
+            self.queue.append(_queued_packet)
         # For unit test
         self.add_to_queue_record.append([timestamp, data_packet, destination_id])
+        # Wake up the process waiting for a data packet
+        if self._packet_event is not None and not self._packet_event.triggered:
+            self._packet_event.succeed()
+
+    def packet_available(self):
+        """
+        Event triggered when the next data packet is added to the RAM queue.
+
+        Returns
+        -------
+        event : simpy Event
+            The event to wait for.
+        """
+        if self._packet_event is None or self._packet_event.triggered:
+            self._packet_event = self.env.event()
+        return self._packet_event
 
     def record_queue_size(self):
         """
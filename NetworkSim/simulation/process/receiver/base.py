@@ -4,7 +4,7 @@ __author__ = ["Hongyi Yang"]
 from collections import deque
 
 from NetworkSim.architecture.setup.model import Model
-from NetworkSim.simulation.tools.clock import TransmitterDataClock, ControlClock, ReceiverDataClock
+from NetworkSim.simulation.tools.dataframe import cached_df
 
 
 class BaseReceiver:
@@ -39,6 +39,10 @@ class BaseReceiver:
         - `Timestamp`
         - `Raw Packet`
         - `Source ID`
+    received_data_packet_df : pandas DataFrame
+        A DataFrame of `received_data_packet`, built when requested.
+    received_control_packet_df : pandas DataFrame
+        A DataFrame of `received_control_packet`, built when requested.
     queue_record : list
         A list keeping the information of the control packets stored in the receiver RAM, including the columns:
 
@@ -62,6 +66,29 @@ class BaseReceiver:
         - `reception_timestamp`
     """
 
+    __slots__ = (
+        'env',
+        'until',
+        'receiver_id',
+        'simulator',
+        'model',
+        'queue',
+        'queue_record',
+        'received_data_packet',
+        'received_control_packet',
+        '_received_data_packet_df',
+        '_received_control_packet_df',
+        '_interpreted_control_packet',
+        '_queue_event',
+        '_transmitter_data_clock_cycle',
+        '_receiver_data_clock_cycle',
+        '_control_clock_cycle',
+        '_circulation_time',
+        '_data_packet_duration',
+        '_queue_circulation_time',
+        '_time_compensation',
+    )
+
     def __init__(
             self,
             env,
@@ -77,20 +104,44 @@ class BaseReceiver:
         if model is None:
             model = Model()
         self.model = model
-        self._transmitter_data_clock_cycle = TransmitterDataClock(model=model).clock_cycle
-        self._receiver_data_clock_cycle = ReceiverDataClock(model=model).clock_cycle
-        self._control_clock_cycle = ControlClock(model=model).clock_cycle
+        self._transmitter_data_clock_cycle = model.get_clock_cycle('transmitter_data')
+        self._receiver_data_clock_cycle = model.get_clock_cycle('receiver_data')
+        self._control_clock_cycle = model.get_clock_cycle('control')
+        # Bind model constants used on every clock cycle
+        self._circulation_time = model.circulation_time
+        self._data_packet_duration = model.data_packet_duration
+        self._queue_circulation_time = model.network.length / model.constants['speed']
         self.received_data_packet = []
         self.received_control_packet = []
+        self._received_data_packet_df = None
+        self._received_control_packet_df = None
         self.queue_record = []
         self.queue = deque()
-        self._fixed_keywords = {'fixed', 'f', 'F'}
-        self._tunable_keywords = {'tunable', 't', 'T'}
-        if self.simulator.receiver_type in self._tunable_keywords:
+        self._interpreted_control_packet = {}  # Interpreted control packets, keyed by their raw packet string
+        self._queue_event = None  # Event triggered by the next control packet added to the queue
+        if self.simulator.receiver_type == 'tunable':
             self._time_compensation = self._receiver_data_clock_cycle - \
-                (self.model.data_packet_duration % self._receiver_data_clock_cycle)
+                (self._data_packet_duration % self._receiver_data_clock_cycle)
         else:
-            self._time_compensation = self._transmitter_data_clock_cycle - self.model.data_packet_duration
+            self._time_compensation = self._transmitter_data_clock_cycle - self._data_packet_duration
+
+    @property
+    def received_data_packet_df(self):
+        return cached_df(
+            process=self,
+            records=self.received_data_packet,
+            cache_attr='_received_data_packet_df',
+            columns=['Timestamp', 'Raw Packet', 'Source ID']
+        )
+
+    @property
+    def received_control_packet_df(self):
+        return cached_df(
+            process=self,
+            records=self.received_control_packet,
+            cache_attr='_received_control_packet_df',
+            columns=['Timestamp', 'Raw Packet', 'Source ID']
+        )
 
     def is_upstream(self, source_id):
         """
@@ -134,8 +185,8 @@ class BaseReceiver:
                 error_type
             ])
         # Check if packet circulates around the ring in TT-FR configuration
-        if self.simulator.receiver_type in self._fixed_keywords \
-                and self.env.now - packet[2] > self.model.circulation_time:
+        if self.simulator.receiver_type == 'fixed' \
+                and self.env.now - packet[2] > self._circulation_time:
             error_type = 'circulation for TT-FR'
             self.simulator.error.append([
                 self.env.now,
@@ -174,14 +225,14 @@ class BaseReceiver:
             The control packet.
         """
         data_rate = (len(self.simulator.latency) + 1) * self.model.data_signal.size * 8 / self.env.now
-        self.simulator.latency.append({
-            'Latency Timestamp': self.env.now,
-            'Source ID': packet[4],  # Source node
-            'Destination ID': packet[5],  # Destination node
-            'Queueing Delay': packet[2] - packet[1],  # Queueing delay
-            'Transfer Delay': self.env.now - packet[1],  # Transfer delay
-            'Data Rate': data_rate
-        })
+        self.simulator.latency.append(
+            self.env.now,
+            packet[4],  # Source node
+            packet[5],  # Destination node
+            packet[2] - packet[1],  # Queueing delay
+            self.env.now - packet[1],  # Transfer delay
+            data_rate
+        )
 
     def control_id_match(self, packet):
         """
@@ -227,10 +278,9 @@ class BaseReceiver:
             control_code=control
         )
         # Return the control packet in receiver RAM queue with the same raw packet and correct circulation time
-        _circulation_time = self.model.network.length / self.model.constants.get('speed')
         for packet in self.queue:
             time_difference = self.env.now - packet[6]
-            if packet[0] == raw_control_packet and not (time_difference % _circulation_time):
+            if packet[0] == raw_control_packet and not (time_difference % self._queue_circulation_time):
                 return packet
         return None
 
@@ -255,11 +305,15 @@ class BaseReceiver:
         # Determine and perform control packet operation
         if not control_code:  # Packet added
             operation = "Added"
-            packet.append(self.env.now)
+            # Keep the reception time with the packet in the queue
+            packet = packet + (self.env.now,)
             if priority == 'high':
                 self.queue.appendleft(packet)
             else:
                 self.queue.append(packet)
+            # Wake up the data reception process waiting for the queue
+            if self._queue_event is not None and not self._queue_event.triggered:
+                self._queue_event.succeed()
         elif control_code == 1:  # Previously added packet now removed
             operation = "Removed"
             original_packet = self.get_original_control_packet(packet=packet)
@@ -415,10 +469,9 @@ class BaseReceiver:
             - `entry_node_id`
             - `destination_node_id`
         """
-        return self.model.control_ring.check_packet(
-            current_time=self.env.now,
-            node_id=self.receiver_id
-        )
+        # All nodes check the control ring at the same time, so share one poll of the ring between them
+        packet = self.model.control_ring.poll_all(current_time=self.env.now).get(self.receiver_id)
+        return packet is not None, packet
 
     def interpret_control_packet(self, packet):
         """
@@ -445,13 +498,15 @@ class BaseReceiver:
         control_code : int
             The control code.
         """
-        return self.model.nodes[self.receiver_id].interpret_control_packet(packet[0])
-
-    def receive_on_control_ring(self):
-        """
-        Process to receive control packets.
-        """
-        raise NotImplementedError("This is an abstract control packet reception process method.")
+        _raw_packet = packet[0]
+        # Abstract packets already hold the decimal IDs and are interpreted directly
+        if self.model.control_signal.abstract:
+            return self.model.nodes[self.receiver_id].interpret_control_packet(_raw_packet)
+        _interpretation = self._interpreted_control_packet.get(_raw_packet)
+        if _interpretation is None:
+            _interpretation = self.model.nodes[self.receiver_id].interpret_control_packet(_raw_packet)
+            self._interpreted_control_packet[_raw_packet] = _interpretation
+        return _interpretation
 
     def receive_on_data_ring(self):
         """
@@ -463,11 +518,8 @@ class BaseReceiver:
         """
         Initialisation of the receiver simulation.
 
-        This function adds two asynchronous receiver processes into the environment:
-
-        - Reception of control packets
-        - Reception of data packets
+        This function adds the reception of data packets into the environment. \
+        The control packets of tunable receivers are received by a single process of the simulator, \
+        shared by all receivers.
         """
-        if self.simulator.receiver_type in self._tunable_keywords:
-            self.env.process(self.receive_on_control_ring())
         self.env.process(self.receive_on_data_ring())
@@ -28,6 +28,8 @@ class FR_D(FR):
         - `Source ID`
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             env,
@@ -28,6 +28,8 @@ class FR_U(BaseReceiver):
         - `Source ID`
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             env,
@@ -64,7 +66,7 @@ class FR_U(BaseReceiver):
                 self.record_error(packet, reversed=True)
                 self.receive_data_packet(ring_id=self.receiver_id, packet=packet, reversed=True)
                 # Wait for the end of the data packet
-                yield self.env.timeout(self.model.data_packet_duration)
+                yield self.env.timeout(self._data_packet_duration)
                 # Record latency information
                 self.record_latency(packet=packet)
                 # Sync with clock
@@ -36,6 +36,10 @@ class TR(BaseReceiver):
         - `Source ID`
     """
 
+    __slots__ = (
+        'data_packet_received',
+    )
+
     def __init__(
             self,
             env,
@@ -53,33 +57,31 @@ class TR(BaseReceiver):
         )
         self.data_packet_received = True
 
-    def receive_on_control_ring(self):
+    def check_control_ring(self):
         """
-        Receiver process to remove a new control packet from the ring.
-
-        This process operates at the control clock frequency, and the control packet would only be removed from the \
-        ring if the destination ID of the packet corresponds to the receiver ID. The receiver would also check \
-        if the data packets reception precess is ready before receiving control packets.
+        One clock cycle of the control packet reception, in which the control packet at the receiver \
+        is received if its destination ID corresponds to the receiver ID.
 
-        In this process:
+        In this clock cycle:
 
-        1. The receiver starts detecting for incoming control packets;
+        1. The receiver detects the incoming control packet;
         2. The receiver checks the destination ID of the control packet received;
-        3. When the IDs match, the receiver removes the control packet from the ring, keeps a record of the \
-        transmission. and informs the data reception subsystem.
-        4. Depends on the control_code, the packet will be added to a queue or remove a packet from the queue;
+        3. When the IDs match, the receiver adds the packet to the queue or removes a packet from the queue, \
+        depending on the control code, then removes the control packet from the ring and keeps a record of \
+        the transmission.
+
+        This is called on every receiver clock cycle by the simulator, \
+        which receives the control packets of all tunable receivers in a single process.
         """
-        while self.env.now <= self.until:
-            present, packet = self.check_control_packet()
-            # Check if a control packet is detected
-            if present:
-                # Check if control packet destination ID matches own ID
-                if self.control_id_match(packet=packet):
-                    # Add received control packet into queue
-                    self.ram_queue_input(packet=packet)
-                    # Remove packet from the ring, keep a record of its information
-                    self.receive_control_packet(packet=packet)
-            yield self.env.timeout(self._receiver_data_clock_cycle)
+        present, packet = self.check_control_packet()
+        # Check if a control packet is detected
+        if present:
+            # Check if control packet destination ID matches own ID
+            if self.control_id_match(packet=packet):
+                # Add received control packet into queue
+                self.ram_queue_input(packet=packet)
+                # Remove packet from the ring, keep a record of its information
+                self.receive_control_packet(packet=packet)
 
     def receive_on_data_ring(self):
         """
@@ -110,14 +112,14 @@ class TR(BaseReceiver):
                     _time_difference = self.env.now - _control_packet[6]
                     # Check if a data packet is received and time is correct
                     if _present and \
-                            (np.isclose(_time_difference % self.model.circulation_time, 0, atol=1e-2) or
-                             np.isclose(_time_difference % self.model.circulation_time,
-                                        self.model.circulation_time, atol=1e-2)):
+                            (np.isclose(_time_difference % self._circulation_time, 0, atol=1e-2) or
+                             np.isclose(_time_difference % self._circulation_time,
+                                        self._circulation_time, atol=1e-2)):
                         # Remove packet from the ring and keep a record of its information
                         self.record_error(_packet)
                         self.receive_data_packet(ring_id=_transmitter_id, packet=_packet)
                         # Wait for the end of the data packet
-                        yield self.env.timeout(self.model.data_packet_duration)
+                        yield self.env.timeout(self._data_packet_duration)
                         # Record latency information
                         self.record_latency(packet=_packet)
                         # Assign flag
@@ -127,4 +129,6 @@ class TR(BaseReceiver):
                     else:
                         yield self.env.timeout(self._receiver_data_clock_cycle)
             else:
-                yield self.env.timeout(self._receiver_data_clock_cycle)
+                # Wait for the next control packet, which is added to the queue on a clock cycle
+                self._queue_event = self.env.event()
+                yield self._queue_event
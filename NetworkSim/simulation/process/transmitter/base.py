@@ -2,7 +2,7 @@ __all__ = ["BaseTransmitter"]
 __author__ = ["Hongyi Yang"]
 
 from NetworkSim.architecture.setup.model import Model
-from NetworkSim.simulation.tools.clock import TransmitterDataClock, ControlClock, ReceiverDataClock
+from NetworkSim.simulation.tools.dataframe import cached_df
 
 
 class BaseTransmitter:
@@ -37,8 +37,29 @@ class BaseTransmitter:
         - `Timestamp`
         - `Raw Packet`
         - `Destination ID`
+    transmitted_data_packet_df : pandas DataFrame
+        A DataFrame of `transmitted_data_packet`, built when requested.
+    transmitted_control_packet_df : pandas DataFrame
+        A DataFrame of `transmitted_control_packet`, built when requested.
     """
 
+    __slots__ = (
+        'env',
+        'ram',
+        'transmitter_id',
+        'simulator',
+        'until',
+        'model',
+        'transmitted_data_packet',
+        'transmitted_control_packet',
+        '_transmitted_data_packet_df',
+        '_transmitted_control_packet_df',
+        '_transmitter_data_clock_cycle',
+        '_receiver_data_clock_cycle',
+        '_control_clock_cycle',
+        '_data_guard_interval',
+    )
+
     def __init__(
             self,
             env,
@@ -56,12 +77,32 @@ class BaseTransmitter:
         if model is None:
             model = Model()
         self.model = model
-        self._transmitter_data_clock_cycle = TransmitterDataClock(model=model).clock_cycle
-        self._receiver_data_clock_cycle = ReceiverDataClock(model=model).clock_cycle
-        self._control_clock_cycle = ControlClock(model=model).clock_cycle
+        self._transmitter_data_clock_cycle = model.get_clock_cycle('transmitter_data')
+        self._receiver_data_clock_cycle = model.get_clock_cycle('receiver_data')
+        self._control_clock_cycle = model.get_clock_cycle('control')
+        self._data_guard_interval = model.constants['data_guard_interval']
         self.transmitted_data_packet = []
         self.transmitted_control_packet = []
-        self._tunable_keywords = {'tunable', 't', 'T'}
+        self._transmitted_data_packet_df = None
+        self._transmitted_control_packet_df = None
+
+    @property
+    def transmitted_data_packet_df(self):
+        return cached_df(
+            process=self,
+            records=self.transmitted_data_packet,
+            cache_attr='_transmitted_data_packet_df',
+            columns=['Timestamp', 'Raw Packet', 'Destination ID']
+        )
+
+    @property
+    def transmitted_control_packet_df(self):
+        return cached_df(
+            process=self,
+            records=self.transmitted_control_packet,
+            cache_attr='_transmitted_control_packet_df',
+            columns=['Timestamp', 'Raw Packet', 'Destination ID']
+        )
 
     def get_packet_from_ram(self, is_upstream=False):
         """
@@ -94,6 +135,20 @@ class BaseTransmitter:
         self.simulator.ram_queue_delay.append(self.env.now - generation_timestamp)
         return generation_timestamp, data_packet, destination_id
 
+    def wait_for_ram_packet(self):
+        """
+        Process to wait for the next data packet added to the RAM, \
+        resuming on the first clock cycle of the transmitter after its arrival.
+
+        This replaces ticking on every clock cycle while the RAM queue is empty.
+        """
+        _start = self.env.now
+        yield self.ram.packet_available()
+        # Index of the first clock cycle after the arrival, counted from the start of the wait,
+        # so that the transmitter resumes on its clock grid
+        _num_cycles = int((self.env.now - _start) // self._transmitter_data_clock_cycle) + 1
+        yield self.env.timeout(_start + _num_cycles * self._transmitter_data_clock_cycle - self.env.now)
+
     def transmit_control_packet(self, packet, destination_id, generation_timestamp):
         """
         Control packet transmission function.
@@ -248,7 +303,7 @@ class BaseTransmitter:
             - `destination_node_id`
         """
         return self.model.data_rings[ring_id].check_packet(
-            current_time=self.env.now + self.model.constants.get('data_guard_interval'),
+            current_time=self.env.now + self._data_guard_interval,
             node_id=self.transmitter_id
         )
 
@@ -270,10 +325,9 @@ class BaseTransmitter:
             - `entry_node_id`
             - `destination_node_id`
         """
-        return self.model.control_ring.check_packet(
-            current_time=self.env.now,
-            node_id=self.transmitter_id
-        )
+        # All nodes check the control ring at the same time, so share one poll of the ring between them
+        packet = self.model.control_ring.poll_all(current_time=self.env.now).get(self.transmitter_id)
+        return packet is not None, packet
 
     def generate_control_packet(self, destination, control):
         """
@@ -306,6 +360,6 @@ class BaseTransmitter:
         """
         Initialisation of the transmitter simulation.
         """
-        if self.simulator.receiver_type in self._tunable_keywords:
+        if self.simulator.receiver_type == 'tunable':
             self.env.process(self.transmit_on_control_ring())
         self.env.process(self.transmit_on_data_ring())
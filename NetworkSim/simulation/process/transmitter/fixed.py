@@ -38,6 +38,12 @@ class FT(BaseTransmitter):
         - `Destination ID`
     """
 
+    __slots__ = (
+        'control_packet_transmitted',
+        'data_packet_transmitted',
+        '_control_packet_event',
+    )
+
     def __init__(
             self,
             env,
@@ -57,6 +63,7 @@ class FT(BaseTransmitter):
         )
         self.control_packet_transmitted = False
         self.data_packet_transmitted = True
+        self._control_packet_event = None  # Event triggered when a control packet is transmitted
 
     def transmit_on_control_ring(self):
         """
@@ -73,8 +80,12 @@ class FT(BaseTransmitter):
         4. The subsystem informs the data transmitter to start transmission.
         """
         while self.env.now <= self.until:
+            # Wait for the RAM when it is empty, and resume on the next clock cycle after the packet arrives
+            if not self.ram.queue:
+                yield from self.wait_for_ram_packet()
+                continue
             # Check if RAM is not empty and if previous data packet has been transmitted
-            if self.ram.queue and not self.ring_is_full(self.transmitter_id):
+            if not self.ring_is_full(self.transmitter_id):
                 # Check if both control and data rings are available
                 control_packet_present, control_packet = self.check_control_packet()
                 data_packet_present, _ = self.check_data_packet(self.transmitter_id)
@@ -90,6 +101,9 @@ class FT(BaseTransmitter):
                         generation_timestamp=generation_timestamp
                     )
                     self.control_packet_transmitted = True
+                    # Inform the data transmission process
+                    if self._control_packet_event is not None and not self._control_packet_event.triggered:
+                        self._control_packet_event.succeed()
             yield self.env.timeout(self._transmitter_data_clock_cycle)
 
     def transmit_on_data_ring(self):
@@ -119,4 +133,8 @@ class FT(BaseTransmitter):
                     generation_timestamp=generation_timestamp
                 )
                 self.control_packet_transmitted = False
-            yield self.env.timeout(self._transmitter_data_clock_cycle)
+                yield self.env.timeout(self._transmitter_data_clock_cycle)
+            else:
+                # Wait for the next control packet, which is transmitted on a clock cycle
+                self._control_packet_event = self.env.event()
+                yield self._control_packet_event
@@ -38,6 +38,11 @@ class TT(BaseTransmitter):
         - `Destination ID`
     """
 
+    __slots__ = (
+        'tuning_delay',
+        'current_ring_id',
+    )
+
     def __init__(
             self,
             env,
@@ -127,4 +132,5 @@ class TT(BaseTransmitter):
                             _data_packet_wait_for_transmit = False
                     yield self.env.timeout(self._transmitter_data_clock_cycle)
             else:
-                yield self.env.timeout(self._transmitter_data_clock_cycle)
+                # Wait for the RAM when it is empty
+                yield from self.wait_for_ram_packet()
@@ -37,6 +37,8 @@ class TT_D(TT):
         - `Destination ID`
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             env,
@@ -90,4 +92,5 @@ class TT_D(TT):
                             _data_packet_wait_for_transmit = False
                     yield self.env.timeout(self._transmitter_data_clock_cycle)
             else:
-                yield self.env.timeout(self._transmitter_data_clock_cycle)
+                # Wait for the RAM when it is empty
+                yield from self.wait_for_ram_packet()
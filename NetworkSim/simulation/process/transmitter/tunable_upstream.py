@@ -38,6 +38,8 @@ class TT_U(TT):
         - `Destination ID`
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             env,
@@ -102,4 +104,5 @@ class TT_U(TT):
                             _data_packet_wait_for_transmit = False
                     yield self.env.timeout(self._transmitter_data_clock_cycle)
             else:
-                yield self.env.timeout(self._transmitter_data_clock_cycle)
+                # Wait for the RAM when it is empty
+                yield from self.wait_for_ram_packet()
@@ -4,7 +4,6 @@ __author__ = ["Hongyi Yang", "Cheuk Ming Chung"]
 from timeit import default_timer as timer
 import simpy
 import pandas as pd
-from tqdm.auto import trange
 from tqdm.auto import tqdm
 import numpy as np
 from scipy.stats import sem as SEM
@@ -20,6 +19,7 @@ from NetworkSim.simulation.process.transmitter.tunable import TT
 from NetworkSim.simulation.process.transmitter.tunable_upstream import TT_U
 from NetworkSim.simulation.process.transmitter.tunable_downstream import TT_D
 from NetworkSim.simulation.tools.info import Info
+from NetworkSim.simulation.tools.latency import LatencyRecord
 from NetworkSim.simulation.tools.summary import Summary
 from NetworkSim.simulation.tools.plot import plot_latency, plot_latency_throughput, plot_count
 
@@ -50,7 +50,7 @@ class BaseSimulator:
         - `tunable`, `t` or `T`
             Tunable transmitter.
 
-        Default is  ``tunable``.
+        Default is  ``tunable``, and the type is stored as either ``'fixed'`` or ``'tunable'``.
     receiver_type: str
         The type of receiver used for the simulation, chosen from the list:
 
@@ -59,7 +59,7 @@ class BaseSimulator:
         - `tunable`, `t`, or `T`
             Tunable receiver.
 
-        Default is  ``fixed``.
+        Default is  ``fixed``, and the type is stored as either ``'fixed'`` or ``'tunable'``.
     traffic_generation_method : str
         The method used for generate source traffic, chosen from the list:
 
@@ -76,8 +76,9 @@ class BaseSimulator:
         The seed used for source traffic generation. Default is ``1``.
 
     ----------
-    latency : list
-        A list of packet transmission latency recorded during the simulation, containing the keys:
+    latency : LatencyRecord
+        A record of packet transmission latency recorded during the simulation, \
+        which behaves as a list of dictionaries containing the keys:
 
         - `Latency Timestamp` : float
             The timestamp when the latency is recorded.
@@ -105,6 +106,16 @@ class BaseSimulator:
             The type of error recorded.
     """
 
+    # Canonical names of the transmitter and receiver types, keyed by the accepted keywords
+    _device_types = {
+        'fixed': 'fixed',
+        'f': 'fixed',
+        'F': 'fixed',
+        'tunable': 'tunable',
+        't': 'tunable',
+        'T': 'tunable'
+    }
+
     def __init__(
             self,
             until=None,
@@ -128,6 +139,8 @@ class BaseSimulator:
         else:
             convergence = False
         self.until = until
+        # End time of the simulator processes, extended batch by batch in convergence mode
+        self._process_until = until
         self.convergence = convergence
         # Check for standard error of mean range
         if convergence:
@@ -151,8 +164,13 @@ class BaseSimulator:
             receiver_type = 'F'
         if traffic_generation_method is None:
             traffic_generation_method = 'poisson'
-        self.transmitter_type = transmitter_type
-        self.receiver_type = receiver_type
+        # Store the device types under their canonical names
+        if transmitter_type not in self._device_types:
+            raise NotImplementedError("Transmitter type not implemented.")
+        if receiver_type not in self._device_types:
+            raise NotImplementedError("Receiver type not implemented.")
+        self.transmitter_type = self._device_types[transmitter_type]
+        self.receiver_type = self._device_types[receiver_type]
         self.traffic_generation_method = traffic_generation_method
         self.bidirectional = bidirectional
         # Check for bidirectional ring consistency
@@ -172,10 +190,8 @@ class BaseSimulator:
         else:
             self.transmitter = [None] * self.model.network.num_nodes
             self.receiver = [None] * self.model.network.num_nodes
-        self._fixed_keywords = {'fixed', 'f', 'F'}
-        self._tunable_keywords = {'tunable', 't', 'T'}
         self.runtime = None
-        self.latency = []
+        self.latency = LatencyRecord()
         self.error = []
         self.TT_FR_tuning_delay = None
         self.ram_queue_delay = []
@@ -203,7 +219,45 @@ class BaseSimulator:
         # Initialise RAM process
         self.RAM[node_id].initialise()
 
-    def _initialise_transmitter(self, node_id):
+    def _get_transmitter_classes(self):
+        """
+        Get the transmitter classes used at each node.
+
+        Returns
+        -------
+        transmitter_classes : tuple
+            The transmitter classes, in the order of upstream and downstream for bi-directional systems.
+        """
+        if self.bidirectional:
+            if self.transmitter_type == 'tunable':
+                return TT_U, TT_D
+            raise NotImplementedError("Only tunable transmitter is implemented for bi-directional systems.")
+        if self.transmitter_type == 'fixed':
+            return FT,
+        if self.transmitter_type == 'tunable':
+            return TT,
+        raise NotImplementedError("Transmitter type not implemented.")
+
+    def _get_receiver_classes(self):
+        """
+        Get the receiver classes used at each node.
+
+        Returns
+        -------
+        receiver_classes : tuple
+            The receiver classes, in the order of upstream and downstream for bi-directional systems.
+        """
+        if self.bidirectional:
+            if self.receiver_type == 'fixed':
+                return FR_U, FR_D
+            raise NotImplementedError("Only fixed receiver is implemented for bi-directional systems.")
+        if self.receiver_type == 'fixed':
+            return FR,
+        if self.receiver_type == 'tunable':
+            return TR,
+        raise NotImplementedError("Receiver type not implemented.")
+
+    def _initialise_transmitter(self, node_id, transmitter_classes=None):
         """
         Transmitter initialisation.
 
@@ -211,56 +265,30 @@ class BaseSimulator:
         ----------
         node_id : int
             ID of the node (transmitter).
+        transmitter_classes : tuple, optional
+            The transmitter classes given by `_get_transmitter_classes`, looked up when not given.
         """
+        if transmitter_classes is None:
+            transmitter_classes = self._get_transmitter_classes()
+        # Create and initialise transmitter processes
+        transmitters = [
+            transmitter_class(
+                env=self.env,
+                until=self.until,
+                ram=self.RAM[node_id],
+                transmitter_id=node_id,
+                model=self.model,
+                simulator=self
+            ) for transmitter_class in transmitter_classes
+        ]
         if self.bidirectional:
-            if self.transmitter_type in self._tunable_keywords:
-                # Transmitter in upstream direction
-                self.upstream_transmitter[node_id] = TT_U(
-                    env=self.env,
-                    until=self.until,
-                    ram=self.RAM[node_id],
-                    transmitter_id=node_id,
-                    model=self.model,
-                    simulator=self
-                )
-                # Transmitter in downstream direction
-                self.downstream_transmitter[node_id] = TT_D(
-                    env=self.env,
-                    until=self.until,
-                    ram=self.RAM[node_id],
-                    transmitter_id=node_id,
-                    model=self.model,
-                    simulator=self
-                )
-            else:
-                raise NotImplementedError("Only tunable transmitter is implemented for bi-directional systems.")
-            self.upstream_transmitter[node_id].initialise()
-            self.downstream_transmitter[node_id].initialise()
+            self.upstream_transmitter[node_id], self.downstream_transmitter[node_id] = transmitters
         else:
-            # Create and initialise transmitter process
-            if self.transmitter_type in self._fixed_keywords:
-                self.transmitter[node_id] = FT(
-                    env=self.env,
-                    until=self.until,
-                    ram=self.RAM[node_id],
-                    transmitter_id=node_id,
-                    model=self.model,
-                    simulator=self
-                )
-            elif self.transmitter_type in self._tunable_keywords:
-                self.transmitter[node_id] = TT(
-                    env=self.env,
-                    until=self.until,
-                    ram=self.RAM[node_id],
-                    transmitter_id=node_id,
-                    model=self.model,
-                    simulator=self
-                )
-            else:
-                raise NotImplementedError("Transmitter type not implemented.")
-            self.transmitter[node_id].initialise()
+            self.transmitter[node_id], = transmitters
+        for transmitter in transmitters:
+            transmitter.initialise()
 
-    def _initialise_receiver(self, node_id):
+    def _initialise_receiver(self, node_id, receiver_classes=None):
         """
         Receiver initialisation.
 
@@ -268,63 +296,85 @@ class BaseSimulator:
         ----------
         node_id : int
             ID of the node (receiver).
+        receiver_classes : tuple, optional
+            The receiver classes given by `_get_receiver_classes`, looked up when not given.
         """
+        if receiver_classes is None:
+            receiver_classes = self._get_receiver_classes()
+        # Create and initialise receiver processes
+        receivers = [
+            receiver_class(
+                env=self.env,
+                until=self.until,
+                receiver_id=node_id,
+                model=self.model,
+                simulator=self
+            ) for receiver_class in receiver_classes
+        ]
         if self.bidirectional:
-            if self.receiver_type in self._fixed_keywords:
-                self.upstream_receiver[node_id] = FR_U(
-                    env=self.env,
-                    until=self.until,
-                    receiver_id=node_id,
-                    model=self.model,
-                    simulator=self
-                )
-                self.downstream_receiver[node_id] = FR_D(
-                    env=self.env,
-                    until=self.until,
-                    receiver_id=node_id,
-                    model=self.model,
-                    simulator=self
-                )
-            else:
-                raise NotImplementedError("Only fixed receiver is implemented for bi-directional systems.")
-            self.upstream_receiver[node_id].initialise()
-            self.downstream_receiver[node_id].initialise()
+            self.upstream_receiver[node_id], self.downstream_receiver[node_id] = receivers
         else:
-            # Create and initialise receiver process
-            if self.receiver_type in self._fixed_keywords:
-                self.receiver[node_id] = FR(
-                    env=self.env,
-                    until=self.until,
-                    receiver_id=node_id,
-                    model=self.model,
-                    simulator=self
-                )
-            elif self.receiver_type in self._tunable_keywords:
-                self.receiver[node_id] = TR(
-                    env=self.env,
-                    until=self.until,
-                    receiver_id=node_id,
-                    model=self.model,
-                    simulator=self
-                )
-            else:
-                raise NotImplementedError("Receiver type not implemented.")
-            self.receiver[node_id].initialise()
+            self.receiver[node_id], = receivers
+        for receiver in receivers:
+            receiver.initialise()
 
     def initialise(self):
         """
         Initialisation of the simulation, where RAM, transmitter, and receiver processes are added to the environment.
         """
         # Check if the combination is implemented
-        if self.transmitter_type in self._fixed_keywords and self.receiver_type in self._fixed_keywords:
+        if self.transmitter_type == 'fixed' and self.receiver_type == 'fixed':
             raise NotImplementedError("The FT-FR model is not implemented.")
-        if self.transmitter_type in self._tunable_keywords and self.receiver_type in self._tunable_keywords:
+        if self.transmitter_type == 'tunable' and self.receiver_type == 'tunable':
             raise NotImplementedError("The TT-TR model is not implemented.")
+        # The process classes are the same at all nodes
+        transmitter_classes = self._get_transmitter_classes()
+        receiver_classes = self._get_receiver_classes()
         # Initialise all three subsystems
         for node_id in range(self.model.network.num_nodes):
             self._initialise_ram(node_id=node_id)
-            self._initialise_transmitter(node_id=node_id)
-            self._initialise_receiver(node_id=node_id)
+            self._initialise_transmitter(node_id=node_id, transmitter_classes=transmitter_classes)
+            self._initialise_receiver(node_id=node_id, receiver_classes=receiver_classes)
+        # Control packets of all tunable receivers are received in one process
+        if receiver_classes == (TR,):
+            self.env.process(self._receive_on_control_ring())
+
+    def _receive_on_control_ring(self):
+        """
+        Process to receive control packets at all tunable receivers, \
+        waking up once per receiver clock cycle instead of once per receiver.
+        """
+        _clock_cycle = self.model.get_clock_cycle('receiver_data')
+        _control_ring = self.model.control_ring
+        while self.env.now <= self._process_until:
+            # Only the receivers with a control packet at their node have anything to do on this cycle
+            for node_id in sorted(_control_ring.poll_all(current_time=self.env.now)):
+                self.receiver[node_id].check_control_ring()
+            yield self.env.timeout(_clock_cycle)
+
+    def _run_until(self, until, desc, leave=True):
+        """
+        Run the simulation environment until the given time, updating the progress bar in a fixed number of steps.
+
+        Parameters
+        ----------
+        until : float
+            The time until which the environment is run.
+        desc : str
+            The description of the progress bar.
+        leave : bool, optional
+            If the progress bar is kept after the run. Default is ``True``.
+        """
+        _start = self.env.now
+        if until <= _start:
+            return
+        _num_steps = 100
+        with tqdm(total=_num_steps, desc=desc, leave=leave) as pbar:
+            for i in range(1, _num_steps):
+                self.env.run(until=_start + (until - _start) * i / _num_steps)
+                pbar.update(1)
+            self.env.run(until=until)
+            pbar.update(1)
 
     def run(self):
         """
@@ -333,9 +383,9 @@ class BaseSimulator:
         _start_time = timer()
         # Fixed-time mode
         if not self.convergence:
+            self._process_until = self.until
             desc = 'Simulator ' + str(self.id) + ' (convergence disabled)'
-            for i in trange(1, self.until, desc=desc):
-                self.env.run(until=i)
+            self._run_until(until=self.until - 1, desc=desc)
         # Automatic convergence mode
         else:
             # initialise parameters
@@ -368,8 +418,7 @@ class BaseSimulator:
                 if start == end:
                     return last_sem, start, last_mean
                 # Calculate batch SEM
-                batch = self.latency[start:]
-                batch_data_rate = list([record['Data Rate'] for record in batch])
+                batch_data_rate = self.latency['Data Rate'][start:]
                 sem = SEM(batch_data_rate) * 2
                 mean_data_rate = np.mean(batch_data_rate)
                 return sem, end, mean_data_rate
@@ -382,6 +431,7 @@ class BaseSimulator:
                 until : int
                     New until value.
                 """
+                self._process_until = until
                 for ram in self.RAM:
                     ram.until = until
                 if self.bidirectional:
@@ -405,9 +455,7 @@ class BaseSimulator:
                 # Update until values and run batch
                 update_until(until=until + self.bs)
                 desc_for = 'Simulator ' + str(self.id) + ' Batch ' + str(batch_number)
-                pbar_for = trange(until, until + self.bs, desc=desc_for, leave=False)
-                for i in pbar_for:
-                    self.env.run(until=i)
+                self._run_until(until=until + self.bs - 1, desc=desc_for, leave=False)
                 # Compute and record batch statistics
                 stats = {}
                 stats['timestamp'] = until + self.bs - 1
@@ -430,8 +478,8 @@ class BaseSimulator:
                 extended_until = int(self.env.now * 1.5) + 1
                 update_until(until=extended_until)
                 desc = 'Simulator ' + str(self.id) + ' Extended Run'
-                for i in trange(extended_begin, extended_until, desc=desc):
-                    self.env.run(until=i)
+                if extended_begin < extended_until:
+                    self._run_until(until=extended_until - 1, desc=desc)
 
         _end_time = timer()
         self.runtime = _end_time - _start_time
@@ -1,8 +1,6 @@
 __all__ = ["TransmitterDataClock", "ReceiverDataClock", "ControlClock"]
 __author__ = ["Hongyi Yang"]
 
-import numpy as np
-
 from NetworkSim.architecture.setup.model import Model
 
 
@@ -21,6 +19,11 @@ class TransmitterDataClock:
         The clock cycle of the synchronised data clock.
     """
 
+    __slots__ = (
+        'model',
+        'clock_cycle',
+    )
+
     def __init__(
             self,
             model=None
@@ -39,12 +42,7 @@ class TransmitterDataClock:
         clock_cycle : float
             The calculated clock cycle for data packet transmission.
         """
-        # Calculate clock cycle and check if it is a good option for simulation
-        if int(self.model.get_max_data_packet_num_on_ring()) & 1:
-            raise ValueError('This configuration would result in data packet '
-                             'transmission clock cycle not being a suitable number.')
-        else:
-            return self.model.circulation_time / self.model.get_max_data_packet_num_on_ring()
+        return self.model.get_clock_cycle('transmitter_data')
 
 
 class ReceiverDataClock(TransmitterDataClock):
@@ -62,6 +60,8 @@ class ReceiverDataClock(TransmitterDataClock):
         The clock cycle of the synchronised data clock.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             model=None
@@ -75,10 +75,7 @@ class ReceiverDataClock(TransmitterDataClock):
         # Unoptimised
         # return super().get_clock_cycle() / self.model.network.num_nodes
         # Optimised
-        return self.model.circulation_time / np.lcm(
-            int(self.model.network.num_nodes),
-            int(self.model.get_max_data_packet_num_on_ring())
-        )
+        return self.model.get_clock_cycle('receiver_data')
 
 
 class ControlClock:
@@ -96,6 +93,11 @@ class ControlClock:
         The clock cycle of the synchronised control clock.
     """
 
+    __slots__ = (
+        'model',
+        'clock_cycle',
+    )
+
     def __init__(
             self,
             model=None
@@ -114,9 +116,4 @@ class ControlClock:
         clock_cycle : float
             The calculated clock cycle for control packet transmission.
         """
-        # Calculate clock cycle and check if it is a good option for simulation
-        if int(self.model.get_max_control_packet_num_on_ring()) & 1:
-            raise ValueError("This configuration would result in control packet "
-                             "transmission clock cycle not being a suitable number.")
-        else:
-            return self.model.circulation_time / self.model.get_max_control_packet_num_on_ring()
+        return self.model.get_clock_cycle('control')
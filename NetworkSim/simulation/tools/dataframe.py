@@ -0,0 +1,32 @@
+__all__ = ["cached_df"]
+__author__ = ["Hongyi Yang"]
+
+import pandas as pd
+
+
+def cached_df(process, records, cache_attr, columns):
+    """
+    Function to get the DataFrame of a packet record kept by a process, \
+    rebuilt only when new packets have been recorded since the last request.
+
+    Parameters
+    ----------
+    process : object
+        The process keeping the record.
+    records : list
+        The packet record, with one entry per packet.
+    cache_attr : str
+        Name of the attribute of `process` in which the DataFrame is cached.
+    columns : list
+        Column names of the DataFrame.
+
+    Returns
+    -------
+    df : pandas DataFrame
+        The DataFrame of the packet record.
+    """
+    df = getattr(process, cache_attr)
+    if df is None or len(df) != len(records):
+        df = pd.DataFrame(records, columns=columns)
+        setattr(process, cache_attr, df)
+    return df
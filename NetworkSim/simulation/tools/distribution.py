@@ -14,8 +14,9 @@ class Distribution:
     ----------
     model : Model, optional
         The network model used for simulation, containing network constants.
-    seed : int, optional
-        The randomisation seed.
+    seed : int or SeedSequence, optional
+        The randomisation seed, from which independent streams are spawned for the interarrival times \
+        and the destinations.
         Default is ``0``.
     """
 
@@ -30,18 +31,29 @@ class Distribution:
         self._pareto_position_parameter, self._pareto_shape_parameter = self.get_pareto_parameters()
         self._poisson_position_parameter, self._poisson_shape_parameter, self.poisson_lambda = \
             self.get_poisson_parameters()
-        np.random.seed(seed)
-
-    def uniform(self):
+        # Interarrival times and destinations are drawn from independent PCG64 streams spawned from the seed,
+        # so that neither depends on the global numpy state or on how the other is sampled
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        _interarrival_seed, _destination_seed = seed.spawn(2)
+        self._interarrival_rng = np.random.default_rng(_interarrival_seed)
+        self._destination_rng = np.random.default_rng(_destination_seed)
+
+    def uniform(self, size=None):
         """
         A uniform distribution to generate a new destination node ID.
 
+        Parameters
+        ----------
+        size : int, optional
+            Number of samples to draw. Default is ``None``, in which case a single value is returned.
+
         Returns
         -------
-        index : int
+        index : int or ndarray
             The index of the destination ID to be chosen.
         """
-        return np.random.randint(low=0, high=self.model.network.num_nodes - 1)
+        return self._destination_rng.integers(low=0, high=self.model.network.num_nodes - 1, size=size)
 
     def get_poisson_parameters(self):
         """
@@ -82,15 +94,23 @@ class Distribution:
         shape_parameter = (_sigma * _lambda_a) / (_sigma - _lambda_a)
         return position_parameter, shape_parameter, _lambda_a
 
-    def poisson(self):
+    def poisson(self, size=None):
         """
         Poisson distribution variate generation.
 
+        Parameters
+        ----------
+        size : int, optional
+            Number of samples to draw. Default is ``None``, in which case a single value is returned.
+
         Returns
         -------
         A new interarrival time calculated from the Poisson distribution.
         """
-        return np.random.exponential(scale=1 / self._poisson_shape_parameter) + self._poisson_position_parameter
+        # Shift the samples in place, without allocating another array
+        interarrival = self._interarrival_rng.exponential(scale=1 / self._poisson_shape_parameter, size=size)
+        interarrival += self._poisson_position_parameter
+        return interarrival
 
     def get_pareto_parameters(self):
         """
@@ -135,12 +155,21 @@ class Distribution:
         position_parameter = 1 / _sigma
         return position_parameter, shape_parameter
 
-    def pareto(self):
+    def pareto(self, size=None):
         """
         Pareto distribution variate generation.
 
+        Parameters
+        ----------
+        size : int, optional
+            Number of samples to draw. Default is ``None``, in which case a single value is returned.
+
         Returns
         -------
         A new interarrival time calculated from the Pareto distribution.
         """
-        return (np.random.pareto(a=self._pareto_shape_parameter) + 1) * self._pareto_position_parameter
+        # Shift and scale the samples in place, without allocating other arrays
+        interarrival = self._interarrival_rng.pareto(a=self._pareto_shape_parameter, size=size)
+        interarrival += 1
+        interarrival *= self._pareto_position_parameter
+        return interarrival
@@ -226,7 +226,7 @@ class Info:
                 _info = self.simulator.model.data_rings[ring_id].packet_record
         else:
             raise ValueError("Type of information requested is not recognised.")
-        return pd.DataFrame(_info, columns=[
+        _info.columns = [
             'Generation Timestamp',
             'Transmission Timestamp',
             'Reception Timestamp',
@@ -235,4 +235,5 @@ class Info:
             'Destination Node ID',
             'Packet Status on Ring',
             'Real-Time Total Packet Count'
-        ])
+        ]
+        return _info
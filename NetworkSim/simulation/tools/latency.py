@@ -0,0 +1,108 @@
+__all__ = ["LatencyRecord"]
+__author__ = ["Hongyi Yang"]
+
+import numpy as np
+
+
+class LatencyRecord:
+    """
+    Record of packet transmission latencies, stored column by column in numpy arrays that grow geometrically.
+
+    The record behaves as a list of dictionaries for indexing, slicing and iteration, \
+    while a whole column is returned as an array when indexed by its key.
+
+    Parameters
+    ----------
+    capacity : int, optional
+        The initial number of rows allocated. Default is ``64``.
+
+    Attributes
+    ----------
+    keys : list
+        The keys of each latency record:
+
+        - `Latency Timestamp` : float
+            The timestamp when the latency is recorded.
+        - `Source ID` : int
+            The ID of the source node.
+        - `Destination ID` : int
+            The ID of the destination node.
+        - `Queueing Delay` : float
+            The recorded queueing delay latency.
+        - `Transfer Delay` : float
+            The recorded transfer delay latency.
+        - `Data Rate` : float
+            The data rate recorded as the operation is completed.
+    """
+
+    __slots__ = (
+        '_size',
+        '_columns',
+    )
+
+    keys = [
+        'Latency Timestamp',
+        'Source ID',
+        'Destination ID',
+        'Queueing Delay',
+        'Transfer Delay',
+        'Data Rate'
+    ]
+    dtypes = [np.float64, np.intp, np.intp, np.float64, np.float64, np.float64]
+
+    def __init__(self, capacity=64):
+        self._size = 0
+        self._columns = [np.empty(capacity, dtype=dtype) for dtype in self.dtypes]
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, item):
+        # Column of the record
+        if isinstance(item, str):
+            return self._columns[self.keys.index(item)][:self._size]
+        # Record of the rows in the slice, sharing memory with this record
+        if isinstance(item, slice):
+            _record = LatencyRecord(capacity=0)
+            _record._columns = [column[:self._size][item] for column in self._columns]
+            _record._size = _record._columns[0].size
+            return _record
+        # Single row
+        if item < 0:
+            item += self._size
+        if not 0 <= item < self._size:
+            raise IndexError('Latency record index out of range.')
+        return {key: column[item].item() for key, column in zip(self.keys, self._columns)}
+
+    def __iter__(self):
+        _columns = [column[:self._size].tolist() for column in self._columns]
+        for row in zip(*_columns):
+            yield dict(zip(self.keys, row))
+
+    def append(self, timestamp, source, destination, queueing_delay, transfer_delay, data_rate):
+        """
+        Append a latency record.
+
+        Parameters
+        ----------
+        timestamp : float
+            The timestamp when the latency is recorded.
+        source : int
+            The ID of the source node.
+        destination : int
+            The ID of the destination node.
+        queueing_delay : float
+            The queueing delay of the packet.
+        transfer_delay : float
+            The transfer delay of the packet.
+        data_rate : float
+            The data rate when the packet is received.
+        """
+        _index = self._size
+        if _index == self._columns[0].size:
+            # Double the capacity when full
+            self._columns = [np.resize(column, max(2 * _index, 64)) for column in self._columns]
+        for column, value in zip(self._columns, (timestamp, source, destination, queueing_delay, transfer_delay,
+                                                 data_rate)):
+            column[_index] = value
+        self._size = _index + 1
@@ -13,6 +13,9 @@ from tqdm.auto import tqdm
 from NetworkSim.simulation.simulator.base import BaseSimulator
 from NetworkSim.simulation.simulator.parallel import ParallelSimulator
 
+# Header written before the pickled simulator, which models saved by NetworkSim 0.2.2 or earlier do not have
+_MODEL_FORMAT = b'NetworkSim model format 2\n'
+
 
 def load_model(fname=None, dir=None):
     """
@@ -31,6 +34,12 @@ def load_model(fname=None, dir=None):
     -------
     simulator : list
         A list of simulators loaded.
+
+    Notes
+    -----
+    Models saved by NetworkSim 0.2.2 or earlier cannot be loaded, as the rings, transmitters, receivers, \
+    RAMs and latency records are stored in a different format. \
+    Such files have no format header, and are reported and skipped.
     """
     dir_path = os.path.dirname(os.path.realpath(__file__))
     if dir is None:
@@ -50,6 +59,9 @@ def load_model(fname=None, dir=None):
                     # with open(filename, 'rb') as input:
                     #     _simulator = pickle.load(input)
                     input = bz2.BZ2File(filename, 'rb')
+                    if input.read(len(_MODEL_FORMAT)) != _MODEL_FORMAT:
+                        print(filename, "was saved by an older version of NetworkSim and cannot be loaded.")
+                        continue
                     _simulator = pickle.load(input)
                     if isinstance(_simulator, BaseSimulator) or isinstance(_simulator, ParallelSimulator):
                         simulators.append(_simulator)
@@ -81,6 +93,10 @@ def clear_env(simulator, minimal):
     simulator.env = None
     for ram_process in simulator.RAM:
         ram_process.env = None
+        # Sample streams are generators and events hold the environment, neither of which can be pickled
+        ram_process._interarrival_stream = None
+        ram_process._destination_stream = None
+        ram_process._packet_event = None
     if simulator.bidirectional:
         for transmitter in simulator.upstream_transmitter:
             transmitter.env = None
@@ -88,8 +104,10 @@ def clear_env(simulator, minimal):
             transmitter.env = None
         for receiver in simulator.upstream_receiver:
             receiver.env = None
+            receiver._queue_event = None
         for receiver in simulator.downstream_receiver:
             receiver.env = None
+            receiver._queue_event = None
         if minimal:
             simulator.upstream_transmitter = None
             simulator.downstream_transmitter = None
@@ -105,8 +123,11 @@ def clear_env(simulator, minimal):
     else:
         for transmitter in simulator.transmitter:
             transmitter.env = None
+            if hasattr(transmitter, '_control_packet_event'):
+                transmitter._control_packet_event = None
         for receiver in simulator.receiver:
             receiver.env = None
+            receiver._queue_event = None
         if minimal:
             simulator.transmitter = None
             simulator.receiver = None
@@ -153,5 +174,6 @@ def save_model(simulator, fname, dir=None, minimal=True):
     # with open(fname, 'wb') as output:
     #     pickle.dump(simulator, output)
     output = bz2.BZ2File(fname, 'w')
+    output.write(_MODEL_FORMAT)
     pickle.dump(simulator, output)
     os.chdir(dir_path)
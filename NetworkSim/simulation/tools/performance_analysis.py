@@ -18,6 +18,29 @@ __author__ = ["Hongyi Yang"]
 import numpy as np
 
 
+def _get_slot_time_and_arrival_rate(simulator):
+    """Function to compute the slot time and the packet arrival rate used in the delay estimates.
+
+    Parameters
+    ----------
+    simulator : BaseSimulator
+        The simulator used to create the network.
+
+    Returns
+    -------
+    t_s : float
+        The time taken by one data packet slot to pass a node.
+    lambda_a : float
+        The average data packet arrival rate at each transmitter.
+    """
+    _model = simulator.model
+    t_s = _model.circulation_time / _model.max_data_packet_num_on_ring
+    lambda_a = _model.constants.get('average_bit_rate') / _model.data_signal.size / 8
+    if simulator.bidirectional:
+        lambda_a /= 2
+    return t_s, lambda_a
+
+
 def get_service_delay(simulator):
     """
     Function to compute the service delay latency of the defined network.
@@ -35,18 +58,14 @@ def get_service_delay(simulator):
     service_delay : float
         The estimated average service delay latency of the network.
     """
+    t_s, lambda_a = _get_slot_time_and_arrival_rate(simulator=simulator)
     t_t = simulator.model.constants.get('tuning_time')
-    t_s = simulator.model.circulation_time / simulator.model.max_data_packet_num_on_ring
-    N = simulator.model.network.num_nodes
-    lambda_a = simulator.model.constants.get('average_bit_rate') / simulator.model.data_signal.size / 8
-    if simulator.bidirectional:
-        lambda_a /= 2
-    W = simulator.model.network.num_nodes
+    N = W = simulator.model.network.num_nodes
     service_delay = t_s / 2 + t_t * (N - 1) / N + (t_s * t_s * N * lambda_a) / (2 * W - t_s * N * lambda_a)
     return service_delay
 
 
-def get_queueing_delay(simulator):
+def get_queueing_delay(simulator, service_delay=None):
     """
     Function to compute the queueing delay latency of the defined network.
 
@@ -57,24 +76,24 @@ def get_queueing_delay(simulator):
     ----------
     simulator : BaseSimulator
         The simulator used to create the network.
+    service_delay : float, optional
+        The service delay given by `get_service_delay`, computed if not given.
 
     Returns
     -------
     queueing_delay : float
         The estimated average queueing delay latency of the network.
     """
-    t_s = simulator.model.circulation_time / simulator.model.max_data_packet_num_on_ring
-    lambda_a = simulator.model.constants.get('average_bit_rate') / simulator.model.data_signal.size / 8
-    if simulator.bidirectional:
-        lambda_a /= 2
-    service_delay = get_service_delay(simulator=simulator)
+    t_s, lambda_a = _get_slot_time_and_arrival_rate(simulator=simulator)
+    if service_delay is None:
+        service_delay = get_service_delay(simulator=simulator)
     queueing_delay = .5 * t_s / (1 - lambda_a * t_s - lambda_a * service_delay)
     if queueing_delay < 0:
         queueing_delay = np.inf
     return queueing_delay
 
 
-def get_transfer_delay(simulator, include_pd=True):
+def get_transfer_delay(simulator, include_pd=True, queueing_delay=None, service_delay=None):
     """
     Function to compute the transfer delay latency of the defined network.
 
@@ -84,6 +103,10 @@ def get_transfer_delay(simulator, include_pd=True):
         The simulator used to create the network.
     include_pd : bool
         If propagation delay is considered. Default is ``True``.
+    queueing_delay : float, optional
+        The queueing delay given by `get_queueing_delay`, computed if not given.
+    service_delay : float, optional
+        The service delay given by `get_service_delay`, computed if not given.
 
     Returns
     -------
@@ -95,12 +118,14 @@ def get_transfer_delay(simulator, include_pd=True):
     else:
         t_pd = 0
     t_tr = simulator.model.data_packet_duration
+    if service_delay is None:
+        service_delay = get_service_delay(simulator=simulator)
+    if queueing_delay is None:
+        queueing_delay = get_queueing_delay(simulator=simulator, service_delay=service_delay)
     if simulator.bidirectional:
-        transfer_delay = get_queueing_delay(simulator=simulator) + \
-            get_service_delay(simulator=simulator) + t_tr + t_pd / 4
+        transfer_delay = queueing_delay + service_delay + t_tr + t_pd / 4
     else:
-        transfer_delay = get_queueing_delay(simulator=simulator) + \
-            get_service_delay(simulator=simulator) + t_tr + t_pd / 2
+        transfer_delay = queueing_delay + service_delay + t_tr + t_pd / 2
     return transfer_delay
 
 
@@ -243,8 +268,8 @@ def _get_delay_results(simulator, latency):
 
     Parameters
     ----------
-    latency : list
-        A list of latency information.
+    latency : LatencyRecord
+        The latency information.
     simulator : BaseSimulator
         The simulator used.
 
@@ -267,13 +292,14 @@ def _get_delay_results(simulator, latency):
             mean transfer delay
     """
     results = {}
-    latency = simulator.latency
-    results['min_queueing_delay'] = np.min(list(item['Queueing Delay'] for item in latency))
-    results['max_queueing_delay'] = np.max(list(item['Queueing Delay'] for item in latency))
-    results['mean_queueing_delay'] = np.mean(list(item['Queueing Delay'] for item in latency))
-    results['min_transfer_delay'] = np.min(list(item['Transfer Delay'] for item in latency))
-    results['max_transfer_delay'] = np.max(list(item['Transfer Delay'] for item in latency))
-    results['mean_transfer_delay'] = np.mean(list(item['Transfer Delay'] for item in latency))
+    _queueing_delay = latency['Queueing Delay']
+    _transfer_delay = latency['Transfer Delay']
+    results['min_queueing_delay'] = np.min(_queueing_delay)
+    results['max_queueing_delay'] = np.max(_queueing_delay)
+    results['mean_queueing_delay'] = np.mean(_queueing_delay)
+    results['min_transfer_delay'] = np.min(_transfer_delay)
+    results['max_transfer_delay'] = np.max(_transfer_delay)
+    results['mean_transfer_delay'] = np.mean(_transfer_delay)
     return results
 
 
@@ -363,8 +389,8 @@ def _get_mean_throughput(simulator, latency):
     ----------
     simulator : BaseSimulator
         The simulator used.
-    latency : list
-        The list of latency information.
+    latency : LatencyRecord
+        The latency information.
 
     Returns
     -------
@@ -129,8 +129,8 @@ def plot_latency_scatter(latency, node_id):
 
     Parameters
     ----------
-    latency : list
-        The list of latency from ``BaseSimulator``.
+    latency : LatencyRecord
+        The latency record from ``BaseSimulator``.
     node_id : int
         The ID of the node of interest.
     """
@@ -217,13 +217,13 @@ def plot_latency_throughput(latency):
 
     Parameters
     ----------
-    latency : list
-        The list of `latency` attribute information from ``BaseSimulator``.
+    latency : LatencyRecord
+        The `latency` attribute information from ``BaseSimulator``.
     """
     init()
-    time = list(item['Latency Timestamp'] for item in latency)
-    delay = list(item['Transfer Delay'] for item in latency)
-    rate = list(item['Data Rate'] for item in latency)
+    time = latency['Latency Timestamp']
+    delay = latency['Transfer Delay']
+    rate = latency['Data Rate']
     y = [delay, rate]
     xlabel = 'Time (ns)'
     ylabels = ['Transfer Delay (ns)', 'Throughput (Gbit/s)']
@@ -498,7 +498,7 @@ def plot_analytical_simulation_latency(simulator, data='auto', show_analytical=T
         elif data_range == 'batch':
             start = simulator.batch_stats[-1]['start_index']
             latency = simulator.latency[start:]
-        delay = np.mean(list(item['Transfer Delay'] for item in latency))
+        delay = np.mean(latency['Transfer Delay'])
         simulation_delay.append(delay)
     # Plot analytical and simulation result
     if np.isinf(max(analytical_delay)):
@@ -512,17 +512,14 @@ def convert_scaled_network_delay_to_df(data_type):
     x, y, labels = _compute_scaled_network_transfer_delay(data_type=data_type)
     if data_type in load_keywards:
         labels = ['10%', '15%', '20%', '25%']
-    df = None
-    for i in range(len(y)):
-        df_temp = pd.DataFrame()
-        df_temp['x'] = x
-        df_temp['y'] = y[i]
-        df_temp['label'] = np.repeat(labels[i], len(x)).tolist()
-        if df is None:
-            df = df_temp.copy()
-        else:
-            df = pd.concat([df, df_temp])
-    return df
+    # Concatenate the frames of all labels at once
+    return pd.concat([
+        pd.DataFrame({
+            'x': x,
+            'y': y[i],
+            'label': np.repeat(labels[i], len(x)).tolist()
+        }) for i in range(len(y))
+    ])
 
 
 def plot_scaled_network_delay(data_type):
@@ -8,6 +8,57 @@ import numpy as np
 import pandas as pd
 
 
+def _sum_by_node_pair(latency, num_nodes, latency_type=None):
+    """
+    Count the latency records of each pair of source and destination nodes, and sum their latencies.
+
+    Parameters
+    ----------
+    latency : LatencyRecord
+        The latency records.
+    num_nodes : int
+        The number of nodes in the network.
+    latency_type : str, optional
+        The latency summed, ``'Transfer Delay'`` or ``'Queueing Delay'``. Default is ``None``, \
+        in which case only the records are counted.
+
+    Returns
+    -------
+    count : ndarray
+        A `n` by `n` array of record counts, where the row index represents the source node \
+        and the column index represents the destination node.
+    total : ndarray
+        A `n` by `n` array of latency sums in the same layout, ``None`` if `latency_type` is not given.
+    """
+    # Flat index of each node pair in the n x n arrays
+    _pair = latency['Source ID'] * num_nodes + latency['Destination ID']
+    count = np.bincount(_pair, minlength=num_nodes * num_nodes).reshape(num_nodes, num_nodes).astype(np.float64)
+    if latency_type is None:
+        return count, None
+    total = np.bincount(_pair, weights=latency[latency_type], minlength=num_nodes * num_nodes)
+    total = total.reshape(num_nodes, num_nodes)
+    return count, total
+
+
+def _count_packets(devices, record):
+    """
+    Count the packets recorded at each device.
+
+    Parameters
+    ----------
+    devices : list
+        The list of RAMs, transmitters or receivers, one per node.
+    record : str
+        The name of the packet record attribute, e.g. ``'generated_data_packet'``.
+
+    Returns
+    -------
+    count : ndarray
+        The number of packets recorded at each device.
+    """
+    return np.fromiter((len(getattr(device, record)) for device in devices), dtype=np.int64, count=len(devices))
+
+
 class Summary:
     """
     Summary class to generate summaries for a given simulator.
@@ -37,6 +88,10 @@ class Summary:
             _direction = 'bi-directional'
         else:
             _direction = 'uni-directional'
+        # Compute the estimated and measured delays once each
+        _service_delay = get_service_delay(self.simulator)
+        _queueing_delay = get_queueing_delay(self.simulator, service_delay=_service_delay)
+        _overall_delay = get_overall_delay(self.simulator)
         _rows = {
             'Total Number of Nodes': self.simulator.model.network.num_nodes,
             'Transmitter Type': self.simulator.transmitter_type,
@@ -47,15 +102,15 @@ class Summary:
             'Designed Maximum Data Rate (Gbit/s)': self.simulator.model.constants['maximum_bit_rate'],
             'Total Number of Data Packet Transmitted': len(self.simulator.latency),
             'Total Number of Transmission Error': len(self.simulator.error),
-            'Estimated Average Queueing Delay (ns)':
-            get_queueing_delay(self.simulator) + get_service_delay(self.simulator),
-            'Estimated Average Transfer Delay (ns)': get_transfer_delay(self.simulator),
-            'Average Queueing Delay Latency (ns)': get_overall_delay(self.simulator)['mean_queueing_delay'],
-            'Average Transfer Delay Latency (ns)': get_overall_delay(self.simulator)['mean_transfer_delay'],
+            'Estimated Average Queueing Delay (ns)': _queueing_delay + _service_delay,
+            'Estimated Average Transfer Delay (ns)':
+            get_transfer_delay(self.simulator, queueing_delay=_queueing_delay, service_delay=_service_delay),
+            'Average Queueing Delay Latency (ns)': _overall_delay['mean_queueing_delay'],
+            'Average Transfer Delay Latency (ns)': _overall_delay['mean_transfer_delay'],
             'Final Data Rate (Gbit/s)': self.simulator.latency[-1]['Data Rate'],
             'Simulation Runtime (s)': self.simulator.runtime
         }
-        summary = pd.DataFrame.from_dict(_rows, orient='index', columns=['Value'])
+        summary = pd.DataFrame({'Value': list(_rows.values())}, index=list(_rows.keys()))
         summary.index.name = 'Simulation Parameter'
         return summary
 
@@ -76,11 +131,9 @@ class Summary:
                 Percentage of data packets generated at each RAM, compared to the total number of data packets \
                 generated in all RAMs in the network.
         """
-        _num_packet = [len(self.simulator.RAM[i].generated_data_packet)
-                       for i in range(self.simulator.model.network.num_nodes)]
-        _total_num_packet = np.sum(_num_packet)
-        _percentage_generated = [_num_packet[i] / _total_num_packet * 100
-                                 for i in range(self.simulator.model.network.num_nodes)]
+        _num_packet = _count_packets(self.simulator.RAM, 'generated_data_packet')
+        _total_num_packet = _num_packet.sum()
+        _percentage_generated = _num_packet / _total_num_packet * 100
         _ram_dict = {
             'RAM ID': list(range(self.simulator.model.network.num_nodes)),
             'Total Number of Data Packet Generated': _num_packet,
@@ -111,16 +164,12 @@ class Summary:
                 Percentage of data packets transmitted from each transmitter, compared to the total number \
                 of data packets transmitted in the network.
         """
-        _num_control_packet = [len(self.simulator.transmitter[i].transmitted_control_packet)
-                               for i in range(self.simulator.model.network.num_nodes)]
-        _num_data_packet = [len(self.simulator.transmitter[i].transmitted_data_packet)
-                            for i in range(self.simulator.model.network.num_nodes)]
-        _total_control_packet = np.sum(_num_control_packet)
-        _total_data_packet = np.sum(_num_data_packet)
-        _percentage_control_packet = [_num_control_packet[i] / _total_control_packet * 100
-                                      for i in range(self.simulator.model.network.num_nodes)]
-        _percentage_data_packet = [_num_data_packet[i] / _total_data_packet * 100
-                                   for i in range(self.simulator.model.network.num_nodes)]
+        _num_control_packet = _count_packets(self.simulator.transmitter, 'transmitted_control_packet')
+        _num_data_packet = _count_packets(self.simulator.transmitter, 'transmitted_data_packet')
+        _total_control_packet = _num_control_packet.sum()
+        _total_data_packet = _num_data_packet.sum()
+        _percentage_control_packet = _num_control_packet / _total_control_packet * 100
+        _percentage_data_packet = _num_data_packet / _total_data_packet * 100
         _transmitter_dict = {
             'Transmitter ID': list(range(self.simulator.model.network.num_nodes)),
             'Total Number of Control Packet Transmitted': _num_control_packet,
@@ -153,16 +202,12 @@ class Summary:
                 Percentage of data packets received at each receiver, compared to the total number \
                 of data packets received in the network.
         """
-        _num_control_packet = [len(self.simulator.receiver[i].received_control_packet)
-                               for i in range(self.simulator.model.network.num_nodes)]
-        _num_data_packet = [len(self.simulator.receiver[i].received_data_packet)
-                            for i in range(self.simulator.model.network.num_nodes)]
-        _total_control_packet = np.sum(_num_control_packet)
-        _total_data_packet = np.sum(_num_data_packet)
-        _percentage_control_packet = [_num_control_packet[i] / _total_control_packet * 100
-                                      for i in range(self.simulator.model.network.num_nodes)]
-        _percentage_data_packet = [_num_data_packet[i] / _total_data_packet * 100
-                                   for i in range(self.simulator.model.network.num_nodes)]
+        _num_control_packet = _count_packets(self.simulator.receiver, 'received_control_packet')
+        _num_data_packet = _count_packets(self.simulator.receiver, 'received_data_packet')
+        _total_control_packet = _num_control_packet.sum()
+        _total_data_packet = _num_data_packet.sum()
+        _percentage_control_packet = _num_control_packet / _total_control_packet * 100
+        _percentage_data_packet = _num_data_packet / _total_data_packet * 100
         _receiver_dict = {
             'Receiver ID': list(range(self.simulator.model.network.num_nodes)),
             'Total Number of Control Packet Received': _num_control_packet,
@@ -233,21 +278,10 @@ class Summary:
         # Initialise n x n array (n is the number of nodes in the network)
         # Row == Source Node, Column == Destination Node
         _n = self.simulator.model.network.num_nodes
+        _count, _latency_sum = _sum_by_node_pair(_latency, _n, latency_type=_type)
+        # Calculate latency mean, which is zero for node pairs without records
         _latency_average = np.zeros([_n, _n])
-        _latency_sum = np.zeros([_n, _n])
-        _count = np.zeros([_n, _n])
-        # Record latency information
-        for latency_info in _latency:
-            _latency_sum[latency_info['Source ID']][latency_info['Destination ID']] += latency_info[_type]
-            _count[latency_info['Source ID']][latency_info['Destination ID']] += 1
-        # Calculate latency mean
-        for i in range(_n):
-            for j in range(_n):
-                if _count[i][j] == 0:
-                    _latency_average[i][j] = 0
-                    # _latency_average[i][j] = np.nan
-                else:
-                    _latency_average[i][j] = _latency_sum[i][j] / _count[i][j]
+        np.divide(_latency_sum, _count, out=_latency_average, where=_count != 0)
         _rows = [i for i in range(_n)]
         _columns = [i for i in range(_n)]
         return pd.DataFrame(_latency_average, index=_rows, columns=_columns)
@@ -265,10 +299,8 @@ class Summary:
         # Initialise n x n array (n is the number of nodes in the network)
         # Row == Source Node, Column == Destination Node
         _n = self.simulator.model.network.num_nodes
-        _count = np.zeros([_n, _n])
         # Record packet transmission information
-        for latency_info in self.simulator.latency:
-            _count[latency_info['Source ID']][latency_info['Destination ID']] += 1
+        _count, _ = _sum_by_node_pair(self.simulator.latency, _n)
         _rows = [i for i in range(_n)]
         _columns = [i for i in range(_n)]
         return pd.DataFrame(_count, index=_rows, columns=_columns)
@@ -288,8 +320,6 @@ class Summary:
         # Row == Source Node, Column == Destination Node
         _n = self.simulator.model.network.num_nodes
         _packet_duration = self.simulator.model.data_packet_duration
-        _count = np.zeros([_n, _n])
-        _sum = np.zeros([_n, _n])
         _packet_info_source_node_pair = [[[] for _ in range(_n)] for _ in range(_n)]
         _mean_packet_delay = np.zeros([_n, _n])
         _std_packet_delay = np.zeros([_n, _n])
@@ -317,18 +347,10 @@ class Summary:
             return pd.DataFrame(_mean_packet_delay, index=_rows, columns=_columns), \
                 pd.DataFrame(_std_packet_delay, index=_rows, columns=_columns)
         else:
-            for latency_info in self.simulator.latency:
-                _count[latency_info['Source ID']][latency_info['Destination ID']] += 1
-                _sum[latency_info['Source ID']][latency_info['Destination ID']] += latency_info['Queueing Delay']
-            for i in range(_n):
-                for j in range(_n):
-                    if _count[i][j] == 0 or _sum[i][j] == 0:
-                        _mean_packet_delay[i][j] = 0
-                    else:
-                        if normalised:
-                            _mean_packet_delay[i][j] = (_sum[i][j] / _count[i][j]) / _packet_duration
-                        else:
-                            _mean_packet_delay[i][j] = (_sum[i][j] / _count[i][j])
+            _count, _sum = _sum_by_node_pair(self.simulator.latency, _n, latency_type='Queueing Delay')
+            np.divide(_sum, _count, out=_mean_packet_delay, where=(_count != 0) & (_sum != 0))
+            if normalised:
+                _mean_packet_delay /= _packet_duration
             return pd.DataFrame(_mean_packet_delay, index=_rows, columns=_columns)
 
     def ram_queue_summary(self):
@@ -362,7 +384,6 @@ class Summary:
         mean_queue_size_bi = []
         max_queue_size_bi = []
         _rows = [i for i in range(_n)]
-        df = pd.DataFrame(index=_rows)
         for ram in self.simulator.RAM:
             if self.simulator.bidirectional:
                 _upstream_queue_record = list(record[1] for record in ram.queue_size_record)
@@ -375,14 +396,23 @@ class Summary:
                 _queue_record = list(record[1] for record in ram.queue_size_record)
                 mean_queue_size.append(np.mean(_queue_record))
                 max_queue_size.append(np.max(_queue_record))
+        # Build the DataFrame in one go from its columns
         if self.simulator.bidirectional:
-            df[['Mean Queue Size (Upstream)', 'Mean Queue Size (Downstream)']] = pd.DataFrame(mean_queue_size_bi)
-            df['Mean Queue Size (Overall)'] = pd.DataFrame(mean_queue_size)
-            df[['Maximum Queue Size (Upstream)', 'Maximum Queue Size (Downstream)']] = pd.DataFrame(max_queue_size_bi)
-            df['Maximum Queue Size (Overall)'] = pd.DataFrame(max_queue_size)
+            mean_queue_size_bi = np.array(mean_queue_size_bi).reshape(-1, 2)
+            max_queue_size_bi = np.array(max_queue_size_bi).reshape(-1, 2)
+            df = pd.DataFrame({
+                'Mean Queue Size (Upstream)': mean_queue_size_bi[:, 0],
+                'Mean Queue Size (Downstream)': mean_queue_size_bi[:, 1],
+                'Mean Queue Size (Overall)': mean_queue_size,
+                'Maximum Queue Size (Upstream)': max_queue_size_bi[:, 0],
+                'Maximum Queue Size (Downstream)': max_queue_size_bi[:, 1],
+                'Maximum Queue Size (Overall)': max_queue_size
+            }, index=_rows)
         else:
-            df['Mean Queue Size'] = pd.DataFrame(mean_queue_size)
-            df['Maximum Queue Size'] = pd.DataFrame(max_queue_size)
+            df = pd.DataFrame({
+                'Mean Queue Size': mean_queue_size,
+                'Maximum Queue Size': max_queue_size
+            }, index=_rows)
         overall_mean = np.mean(list(mean for mean in mean_queue_size))
         overall_max = np.max(list(mean for mean in max_queue_size))
         return overall_mean, overall_max, df
@@ -5,6 +5,9 @@ __all__ = [
 ]
 
 import os
+import sys
+
+import numpy as np
 
 from NetworkSim.simulation.simulator.base import BaseSimulator
 
@@ -24,13 +27,20 @@ def print_delay_lut(simulator=None, upstream=False):
         delay = simulator.upstream_transmitter[0].tuning_delay
     else:
         delay = simulator.downstream_transmitter[0].tuning_delay
-    for i in range(100):
-        for j in range(100):
-            print(
-                "14'b" + str(bin(i + 1)[2:].zfill(7)) + str(bin(j + 1)[2:].zfill(7)) + ":",
-                "delay <= 8'b" + str(bin(int(delay[i, j]))[2:].zfill(8)) + ";",
-                "// curr:", i + 1, "dest:", j + 1, "delay:", int(delay[i, j])
-            )
+    # The LUT entries are 8-bit, so the delays are stored as uint8 and formatted from a lookup table
+    _delay = delay[:100, :100].astype(int)
+    if _delay.min() < 0 or _delay.max() >= 2 ** 8:
+        raise ValueError('Tuning delays must be between 0 and 255 to fit in the 8-bit delay LUT.')
+    _delay = _delay.astype(np.uint8).tolist()
+    _bin7 = [format(k, '07b') for k in range(2 ** 7)]
+    _bin8 = [format(k, '08b') for k in range(2 ** 8)]
+    # Print all LUT entries in a single write
+    sys.stdout.write(''.join(
+        "14'b%s%s: delay <= 8'b%s; // curr: %d dest: %d delay: %d\n" % (
+            _bin7[i + 1], _bin7[j + 1], _bin8[_delay[i][j]], i + 1, j + 1, _delay[i][j]
+        )
+        for i in range(100) for j in range(100)
+    ))
 
 
 def generate_testvector(
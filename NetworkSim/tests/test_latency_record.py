@@ -0,0 +1,21 @@
+import numpy as np
+
+from NetworkSim.simulation.tools.latency import LatencyRecord
+
+
+def test_latency_record():
+    records = [
+        [10.0 * i, i, i + 1, 1.5 * i, 2.5 * i, 0.1 * i] for i in range(100)
+    ]
+    latency = LatencyRecord(capacity=4)
+    for record in records:
+        latency.append(*record)
+    # Check the record behaves as a list of dictionaries
+    np.testing.assert_equal(len(latency), len(records))
+    for latency_info, record in zip(latency, records):
+        np.testing.assert_equal(latency_info, dict(zip(LatencyRecord.keys, record)))
+    np.testing.assert_equal(latency[-1], dict(zip(LatencyRecord.keys, records[-1])))
+    np.testing.assert_equal(list(latency[20:30]), list(latency)[20:30])
+    # Check the columns
+    np.testing.assert_array_equal(latency['Source ID'], [record[1] for record in records])
+    np.testing.assert_array_equal(latency[50:]['Transfer Delay'], [record[4] for record in records[50:]])
@@ -34,12 +34,12 @@ def test_control_packet_location_on_ring():
                                 transmission_timestamp=test_time[i])
     presence_expected = [True, True, True, True, True, True]
     packet_expected = [
-        ['000000000', 0, 0, 0, 0, -1],
-        ['000000001', 5, 5, 50, 50, -1],
-        ['000000011', 10, 10, 99, 99, -1],
-        ['000000000', 0, 0, 0, 0, -1],
-        ['000000001', 5, 5, 50, 50, -1],
-        ['000000011', 10, 10, 99, 99, -1]
+        ('000000000', 0, 0, 0, 0, -1),
+        ('000000001', 5, 5, 50, 50, -1),
+        ('000000011', 10, 10, 99, 99, -1),
+        ('000000000', 0, 0, 0, 0, -1),
+        ('000000001', 5, 5, 50, 50, -1),
+        ('000000011', 10, 10, 99, 99, -1)
     ]
     presence_test = [None] * 6
     packet_test = [None] * 6
@@ -69,12 +69,12 @@ def test_data_packet_location_on_ring():
                              transmission_timestamp=test_time[i])
     presence_expected = [True, True, True, True, True, True]
     packet_expected = [
-        ['00000000', 0, 0, 0, 0, -1],
-        ['00001111', 20, 20, 50, 50, -1],
-        ['11111111', 40, 40, 99, 99, -1],
-        ['00000000', 0, 0, 0, 0, -1],
-        ['00001111', 20, 20, 50, 50, -1],
-        ['11111111', 40, 40, 99, 99, -1]
+        ('00000000', 0, 0, 0, 0, -1),
+        ('00001111', 20, 20, 50, 50, -1),
+        ('11111111', 40, 40, 99, 99, -1),
+        ('00000000', 0, 0, 0, 0, -1),
+        ('00001111', 20, 20, 50, 50, -1),
+        ('11111111', 40, 40, 99, 99, -1)
     ]
     presence_test = [None] * 6
     packet_test = [None] * 6
@@ -106,9 +106,9 @@ def test_data_packet_location_on_reversed_ring():
     presence_expected = [True] * num_test
     packet_expected = []
     for i in range(int(num_test / 3)):
-        packet_expected.append(['00000000', 0, 0, 0, 0, -1])
-        packet_expected.append(['00001111', 20, 20, 50, 50, -1])
-        packet_expected.append(['11111111', 40, 40, 99, 99, -1])
+        packet_expected.append(('00000000', 0, 0, 0, 0, -1))
+        packet_expected.append(('00001111', 20, 20, 50, 50, -1))
+        packet_expected.append(('11111111', 40, 40, 99, 99, -1))
     presence_test = [None] * num_test
     packet_test = [None] * num_test
     # Check packet
@@ -121,3 +121,46 @@ def test_data_packet_location_on_reversed_ring():
 
     assert presence_test == presence_expected
     assert packet_test == packet_expected
+
+
+def test_packet_record_on_ring():
+    data_ring = Ring(model=test_model, time_unit='s')
+    # Add enough packets to grow the record, then remove them at their entry nodes
+    for i in range(100):
+        data_ring.add_packet(node_id=i,
+                             destination_id=i,
+                             packet='00000000',
+                             generation_timestamp=0,
+                             transmission_timestamp=1)
+    for i in range(100):
+        _, packet = data_ring.check_packet(current_time=1, node_id=i)
+        data_ring.remove_packet(node_id=i, packet=packet, reception_timestamp=2)
+    packet_record = data_ring.packet_record
+    assert len(packet_record) == 200
+    assert list(packet_record['Status']) == ['added'] * 100 + ['removed'] * 100
+    assert list(packet_record['Total Packet Count']) == list(range(1, 101)) + list(range(99, -1, -1))
+    assert packet_record['Reception Timestamp'][:100].isna().all()
+    assert (packet_record['Reception Timestamp'][100:] == 2).all()
+    assert list(packet_record['Source Node'][100:]) == list(range(100))
+    assert list(packet_record['Destination Node'][100:]) == list(range(100))
+
+
+def test_poll_all_nodes_on_ring():
+    for reversed in [False, True]:
+        data_ring = Ring(model=test_model, time_unit='s', reversed=reversed)
+        test_nodes = [0, 50, 99, 3]
+        test_time = [0, 20, 40, 40.5]
+        for i in range(4):
+            data_ring.add_packet(node_id=test_nodes[i],
+                                 destination_id=-1,
+                                 packet='00000000',
+                                 generation_timestamp=test_time[i],
+                                 transmission_timestamp=test_time[i])
+        # Polling all nodes at once should give the same packets as checking each node
+        for check_time in [40, 41, 99, 100, 139.999, 1000.5, 3490]:
+            packets_expected = {}
+            for node_id in range(100):
+                present, packet = data_ring.check_packet(current_time=check_time, node_id=node_id)
+                if present:
+                    packets_expected[node_id] = packet
+            assert data_ring.poll_all(current_time=check_time) == packets_expected
@@ -0,0 +1,62 @@
+import numpy as np
+
+from NetworkSim.simulation.simulator.base import BaseSimulator
+from NetworkSim.simulation.tools.performance_analysis import get_extended_run_delay, get_final_batch_delay, \
+    get_overall_delay
+
+
+def run_convergence_simulation(transmitter_type, receiver_type):
+    simulator = BaseSimulator(
+        until=None,
+        convergence=True,
+        sem_tr=0.5,
+        bs=500,
+        transmitter_type=transmitter_type,
+        receiver_type=receiver_type
+    )
+    simulator.initialise()
+    simulator.run()
+    return simulator
+
+
+def check_convergence(simulator):
+    # Each batch extends the simulation by the batch size
+    timestamps = [stats['timestamp'] for stats in simulator.batch_stats]
+    np.testing.assert_array_equal(timestamps, np.arange(1, len(timestamps) + 1) * simulator.bs)
+    # The batches cover all latency records up to the end of the last batch
+    assert simulator.batch_stats[-1]['end_index'] > 0
+    assert simulator.latency[simulator.batch_stats[-1]['end_index'] - 1]['Latency Timestamp'] <= timestamps[-1]
+    # The extended run continues beyond the last batch
+    assert simulator.env.now > timestamps[-1]
+
+
+def test_fixed_transmitter_tunable_receiver_convergence():
+    simulator = run_convergence_simulation(transmitter_type='f', receiver_type='t')
+    check_convergence(simulator)
+    # All tunable receivers keep receiving control packets after the first batch
+    _first_batch_end = simulator.batch_stats[0]['timestamp']
+    for receiver in simulator.receiver:
+        assert receiver.received_control_packet[-1][0] > _first_batch_end
+
+
+def test_tunable_transmitter_fixed_receiver_convergence():
+    simulator = run_convergence_simulation(transmitter_type='t', receiver_type='f')
+    check_convergence(simulator)
+
+
+def test_batch_delay():
+    simulator = run_convergence_simulation(transmitter_type='t', receiver_type='f')
+    start = simulator.batch_stats[-1]['start_index']
+    end = simulator.batch_stats[-1]['end_index']
+    overall_delay = get_overall_delay(simulator)
+    # The delays of the final batch and the extended run are computed from their own latency records
+    for delay, latency in [
+        (get_final_batch_delay(simulator), simulator.latency[start:end]),
+        (get_extended_run_delay(simulator), simulator.latency[end:])
+    ]:
+        for delay_type in ['queueing', 'transfer']:
+            _delay = [latency_info[delay_type.capitalize() + ' Delay'] for latency_info in latency]
+            np.testing.assert_allclose(delay['min_' + delay_type + '_delay'], np.min(_delay))
+            np.testing.assert_allclose(delay['max_' + delay_type + '_delay'], np.max(_delay))
+            np.testing.assert_allclose(delay['mean_' + delay_type + '_delay'], np.mean(_delay))
+        assert delay['mean_queueing_delay'] != overall_delay['mean_queueing_delay']
@@ -14,11 +14,11 @@ def test_fixed_transmitter_data_transmission():
     for i in range(simulator.model.network.num_nodes):
         transmitted_packet = simulator.transmitter[i].transmitted_data_packet
         generated_packet = simulator.RAM[i].generated_data_packet
-        for j in range(len(transmitted_packet)):
-            np.testing.assert_array_equal(
-                transmitted_packet[j][1:],
-                generated_packet[j][2:]
-            )
+        # Compare the raw data and destination of all transmitted packets at once
+        np.testing.assert_array_equal(
+            [[*packet[1], packet[2]] for packet in transmitted_packet],
+            [[*packet[2], packet[3]] for packet in generated_packet[:len(transmitted_packet)]]
+        )
 
 
 def test_tunable_transmitter_data_transmission():
@@ -32,11 +32,11 @@ def test_tunable_transmitter_data_transmission():
     for i in range(simulator.model.network.num_nodes):
         transmitted_packet = simulator.transmitter[i].transmitted_data_packet
         generated_packet = simulator.RAM[i].generated_data_packet
-        for j in range(len(transmitted_packet)):
-            np.testing.assert_array_equal(
-                transmitted_packet[j][1:],
-                generated_packet[j][2:]
-            )
+        # Compare the raw data and destination of all transmitted packets at once
+        np.testing.assert_array_equal(
+            [[*packet[1], packet[2]] for packet in transmitted_packet],
+            [[*packet[2], packet[3]] for packet in generated_packet[:len(transmitted_packet)]]
+        )
 
 
 def test_bidirectional_tunable_transmitter_data_transmission():
@@ -62,20 +62,15 @@ def test_bidirectional_tunable_transmitter_data_transmission():
         upstream_transmitted_packet = simulator.upstream_transmitter[i].transmitted_data_packet
         downstream_transmitted_packet = simulator.downstream_transmitter[i].transmitted_data_packet
         generated_packet = simulator.RAM[i].generated_data_packet
-        upstream_counter = 0
-        downstream_counter = 0
-        for j in range(len(generated_packet)):
-            if is_upstream(simulator, i, generated_packet[j][3]) and \
-                    upstream_counter < len(upstream_transmitted_packet):
-                np.testing.assert_array_equal(
-                    upstream_transmitted_packet[upstream_counter][1:],
-                    generated_packet[j][2:]
-                )
-                upstream_counter += 1
-            elif not is_upstream(simulator, i, generated_packet[j][3]) and \
-                    downstream_counter < len(downstream_transmitted_packet):
-                np.testing.assert_array_equal(
-                    downstream_transmitted_packet[downstream_counter][1:],
-                    generated_packet[j][2:]
-                )
-                downstream_counter += 1
+        # Split the generated packets by direction and compare each direction at once
+        upstream_generated_packet = [packet for packet in generated_packet if is_upstream(simulator, i, packet[3])]
+        downstream_generated_packet = [packet for packet in generated_packet
+                                       if not is_upstream(simulator, i, packet[3])]
+        np.testing.assert_array_equal(
+            [[*packet[1], packet[2]] for packet in upstream_transmitted_packet],
+            [[*packet[2], packet[3]] for packet in upstream_generated_packet[:len(upstream_transmitted_packet)]]
+        )
+        np.testing.assert_array_equal(
+            [[*packet[1], packet[2]] for packet in downstream_transmitted_packet],
+            [[*packet[2], packet[3]] for packet in downstream_generated_packet[:len(downstream_transmitted_packet)]]
+        )
@@ -15,11 +15,10 @@ def test_fixed_transmitter_ram_queue_deque():
         add_to_queue_record = simulator.transmitter[i].ram.add_to_queue_record
         pop_from_queue_record = simulator.transmitter[i].ram.pop_from_queue_record
         # pop_from_queue will always be equal or shorter than add_to_queue, if some data doesnt get transmitted
-        for j in range(len(pop_from_queue_record)):
-            np.testing.assert_array_equal(
-                add_to_queue_record[j],
-                pop_from_queue_record[j]
-            )
+        np.testing.assert_array_equal(
+            [[record[0], *record[1], record[2]] for record in add_to_queue_record[:len(pop_from_queue_record)]],
+            [[record[0], *record[1], record[2]] for record in pop_from_queue_record]
+        )
 
 
 def test_tunable_transmitter_ram_queue_deque():
@@ -34,8 +33,7 @@ def test_tunable_transmitter_ram_queue_deque():
         add_to_queue_record = simulator.transmitter[i].ram.add_to_queue_record
         pop_from_queue_record = simulator.transmitter[i].ram.pop_from_queue_record
         # pop_from_queue will always be equal or shorter than add_to_queue, if some data doesnt get transmitted
-        for j in range(len(pop_from_queue_record)):
-            np.testing.assert_array_equal(
-                add_to_queue_record[j],
-                pop_from_queue_record[j]
-            )
+        np.testing.assert_array_equal(
+            [[record[0], *record[1], record[2]] for record in add_to_queue_record[:len(pop_from_queue_record)]],
+            [[record[0], *record[1], record[2]] for record in pop_from_queue_record]
+        )